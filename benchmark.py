@@ -0,0 +1,333 @@
+"""CSC111 Project 1: Text Adventure Game - Benchmarks
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module times the parts of the game whose speed matters most: loading game data (game_data.json, and
+generated worlds with many more locations) in each of the ways load_world can load it, applying commands, replaying
+walkthroughs with AdventureGameSimulation, and adding, listing and removing the events of an event log with 10^3 to
+10^6 events.
+
+Every benchmark is run a few times and its best time is kept, since slower runs are slowed down by something else
+on the machine. Run the benchmarks from the command line with:
+
+    python benchmark.py --save baseline.json
+
+to save the results as a baseline, and later (after changing the code) with:
+
+    python benchmark.py --compare baseline.json
+
+to report how each benchmark changed since the baseline. Any benchmark more than --tolerance (25% by default)
+slower than its baseline is a regression, and the comparison then exits with status 1.
+
+BASELINE_FILE (baseline.json) holds the results saved from the current code, along with the Python version and
+machine they were measured on. Times from a different machine are only a rough guide, so save a baseline of your
+own before changing the code when comparing on another machine.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from adventure import AdventureGame
+from event_logger import CompactEventList, Event, EventList
+from lazy_world import INDEX_SUFFIX, load_lazy_world
+from simulation import AdventureGameSimulation
+from world_compiler import compile_world_file, load_compiled_world
+from world_generator import write_world
+from world_template import WorldTemplate, parse_world
+
+# The number of locations in the generated worlds (see world_generator.py) that loading is timed on
+WORLD_SIZES = [1_000, 10_000, 100_000]
+
+# The numbers of events in the event logs that are timed
+EVENT_COUNTS = [1_000, 10_000, 100_000, 1_000_000]
+
+# The baseline kept with the code, saved from its current version
+BASELINE_FILE = 'baseline.json'
+
+# The default number of times each benchmark is run (the best time is kept)
+REPEAT = 5
+
+# How much slower than its baseline a benchmark may be before it is a regression
+TOLERANCE = 0.25
+
+# The commands that win the game in game_data.json (the same walkthrough as in simulation.py)
+WIN_WALKTHROUGH = ["take t_card", "go north", "go east", "go north", "take usb_drive", "go south", "go south",
+                   "take laptop_charger", "go north", "go north", "go east", "take lucky_mug", "go west", "go south",
+                   "go west", "go south", "drop usb_drive", "drop laptop_charger", "drop lucky_mug"]
+
+
+def time_best(run: Callable[..., Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> float:
+    """Return the shortest time (in seconds) that one call to run took, out of repeat calls.
+
+    If setup is given, it is called before each call to run (untimed), and its return value is passed to run.
+    The garbage collector is paused while run is timed, as timeit does.
+
+    Preconditions:
+        - repeat > 0
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            if setup is not None:
+                run(argument)
+            else:
+                run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return best
+
+
+def _parse_file(filename: str) -> WorldTemplate:
+    """Return the world template for the given game data file, parsing all of it (as load_world does for a file
+    smaller than LAZY_LOAD_THRESHOLD, the first time it is loaded)."""
+    with open(filename, 'r') as f:
+        return parse_world(json.load(f))
+
+
+def bench_load_paths(name: str, filename: str, repeat: int) -> dict[str, float]:
+    """Return the time to load the given game data file (called name in the results) in each way load_world can load
+    it: parsing all of its JSON, lazily before and after its location index is written (see lazy_world.py), and from
+    its compiled form (see world_compiler.py).
+
+    Templates are loaded with the loaders load_world calls, since load_world itself would return the template it
+    loaded the first time.
+    """
+    compiled_file = filename + '.world'
+    compile_world_file(filename, compiled_file)
+    index_file = filename + INDEX_SUFFIX
+
+    def remove_index() -> None:
+        if os.path.exists(index_file):
+            os.remove(index_file)
+
+    # The lazy loader writes the index the first time, so it is timed without the index first
+    return {f'load/json_{name}': time_best(lambda: _parse_file(filename), repeat),
+            f'load/lazy_unindexed_{name}': time_best(lambda _: load_lazy_world(filename), repeat, remove_index),
+            f'load/lazy_{name}': time_best(lambda: load_lazy_world(filename), repeat),
+            f'load/compiled_{name}': time_best(lambda: load_compiled_world(compiled_file), repeat)}
+
+
+def bench_loading(repeat: int, world_sizes: list[int]) -> dict[str, float]:
+    """Return the time to load game_data.json, and a generated world of each of the given sizes, in each way
+    load_world can load them (see bench_load_paths), and the time to start a game in a world that is already
+    loaded."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        results.update(bench_load_paths('game_data', shutil.copy('game_data.json', directory), repeat))
+        for size in world_sizes:
+            filename = os.path.join(directory, f"world_{size}.json")
+            with open(filename, 'w') as f:
+                write_world(f, size)
+            results.update(bench_load_paths(f'generated_{size}', filename, repeat))
+    results['load/new_game'] = time_best(lambda: AdventureGame('game_data.json', 1), repeat)
+    return results
+
+
+def bench_commands(repeat: int, count: int = 10_000) -> dict[str, float]:
+    """Return the average time for AdventureGame.execute to apply a menu command, a move, and an item command
+    (taking and dropping an item), out of count commands of each kind."""
+    def new_game() -> AdventureGame:
+        game = AdventureGame('game_data.json', 1)
+        game.max_moves = count * 2 + 1
+        return game
+
+    def look(game: AdventureGame) -> None:
+        for _ in range(count):
+            game.execute("look")
+
+    def move(game: AdventureGame) -> None:
+        for _ in range(count // 2):
+            game.execute("go north")
+            game.execute("go south")
+
+    def take_drop(game: AdventureGame) -> None:
+        for _ in range(count // 2):
+            game.execute("take t_card")
+            game.execute("drop t_card")
+
+    return {'execute/menu': time_best(look, repeat, new_game) / count,
+            'execute/move': time_best(move, repeat, new_game) / count,
+            'execute/take_drop': time_best(take_drop, repeat, new_game) / count}
+
+
+def bench_simulation(repeat: int, count: int = 200) -> dict[str, float]:
+    """Return the average time for AdventureGameSimulation to play the winning walkthrough from start to finish,
+    out of count walkthroughs."""
+    def play() -> None:
+        for _ in range(count):
+            AdventureGameSimulation('game_data.json', 1, WIN_WALKTHROUGH).get_outcome()
+
+    return {'simulation/win_walkthrough': time_best(play, repeat) / count}
+
+
+def bench_event_lists(repeat: int, event_counts: list[int]) -> dict[str, float]:
+    """Return the time for EventList and CompactEventList to add, list the ids of, and remove each of the given
+    numbers of events."""
+    results = {}
+    for event_list_class in (EventList, CompactEventList):
+        prefix = f"events/{event_list_class.__name__}"
+        for n in event_counts:
+            events = [Event(k % 7 + 1, "A description.") for k in range(n)]
+
+            def add(log: EventList) -> None:
+                log.add_event(events[0])
+                for event in events[1:]:
+                    log.add_event(event, "go north")
+
+            def filled() -> EventList:
+                log = event_list_class()
+                add(log)
+                return log
+
+            def remove(log: EventList) -> None:
+                for _ in range(n):
+                    log.remove_last_event()
+
+            # The largest lists take a while to build, so they are timed fewer times
+            runs = repeat if n < 1_000_000 else min(repeat, 2)
+            results[f'{prefix}/add_{n}'] = time_best(add, runs, event_list_class)
+            log = filled()
+            results[f'{prefix}/get_id_log_{n}'] = time_best(log.get_id_log, runs)
+            del log
+            results[f'{prefix}/remove_{n}'] = time_best(remove, runs, filled)
+    return results
+
+
+def run_benchmarks(repeat: int = REPEAT, world_sizes: Optional[list[int]] = None,
+                   event_counts: Optional[list[int]] = None, only: Optional[str] = None) -> dict[str, float]:
+    """Run the benchmarks and return a mapping from the name of each benchmark to its best time, in seconds.
+
+    If only is given, only the groups of benchmarks ("load", "execute", "simulation" or "events") whose names start
+    with it are run.
+
+    Preconditions:
+        - repeat > 0
+    """
+    groups = {
+        'load': lambda: bench_loading(repeat, WORLD_SIZES if world_sizes is None else world_sizes),
+        'execute': lambda: bench_commands(repeat),
+        'simulation': lambda: bench_simulation(repeat),
+        'events': lambda: bench_event_lists(repeat, EVENT_COUNTS if event_counts is None else event_counts)
+    }
+    results = {}
+    for name, group in groups.items():
+        if only is None or name.startswith(only):
+            results.update(group())
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            tolerance: float = TOLERANCE) -> tuple[list[str], list[str]]:
+    """Return (1) a line of report for each benchmark in results, comparing it with its time in baseline, and
+    (2) the names of the benchmarks more than tolerance slower than their baseline.
+
+    >>> lines, regressions = compare({'a': 2.0, 'b': 1.0, 'c': 1.0}, {'a': 1.0, 'b': 1.0})
+    >>> regressions
+    ['a']
+    >>> lines[2].split()
+    ['c', '1.000s', '(no', 'baseline)']
+    """
+    lines = []
+    regressions = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            lines.append(f"{name:<44} {format_time(seconds):>9}  (no baseline)")
+            continue
+        ratio = seconds / baseline[name] if baseline[name] > 0 else float('inf')
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + tolerance):
+            flag = "  faster"
+        lines.append(f"{name:<44} {format_time(seconds):>9}  vs {format_time(baseline[name]):>9}  "
+                     f"({ratio:.2f}x){flag}")
+    return lines, regressions
+
+
+def format_time(seconds: float) -> str:
+    """Return the given time in the most readable unit.
+
+    >>> format_time(0.0000025), format_time(0.0031), format_time(2)
+    ('2.50us', '3.10ms', '2.000s')
+    """
+    if seconds < 0.001:
+        return f"{seconds * 1e6:.2f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmarks from the command line, saving or comparing against a baseline. Return the exit status:
+    1 if a benchmark regressed, and 0 otherwise."""
+    parser = argparse.ArgumentParser(description="Time the game's loading, commands, simulation and event logs.")
+    parser.add_argument('--save', default=None, help="save the results as a baseline in this file")
+    parser.add_argument('--compare', default=None, help="compare the results with the baseline in this file")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help="how much slower than its baseline a benchmark may be (0.25 is 25%%)")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="number of times to run each benchmark")
+    parser.add_argument('--only', default=None, help="only run this group: load, execute, simulation or events")
+    parser.add_argument('--max-events', type=int, default=EVENT_COUNTS[-1], help="largest event log to time")
+    args = parser.parse_args(argv)
+
+    event_counts = [n for n in EVENT_COUNTS if n <= args.max_events]
+    results = run_benchmarks(args.repeat, event_counts=event_counts, only=args.only)
+
+    status = 0
+    if args.compare is not None:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)['results']
+        lines, regressions = compare(results, baseline, args.tolerance)
+        print('\n'.join(lines))
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            status = 1
+    else:
+        for name, seconds in results.items():
+            print(f"{name:<44} {format_time(seconds):>9}")
+
+    if args.save is not None:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'results': results}, f,
+                      indent=2)
+    return status
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,280 @@
+"""CSC111 Project 1: Text Adventure Game - Event Journal
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module keeps a game's event log on disk as well as in memory, so that a game survives a crash and can
+be audited afterwards.
+
+A journal is a JSON Lines file that is only ever appended to. Its first line describes the game, and every other line
+records one change to the event log:
+    - {"game": <game data file>, "start": <initial location id>, "max_moves": <move limit>}
+    - {"id": <location id>, "command": <command that reached it, or null>} for each event added
+    - {"remove": true} for each event removed
+
+Lines are written as soon as the event is added, but only forced onto the disk (with fsync) every few lines, since
+forcing every line is slow. A crash can lose at most the last few lines, and a line cut off by a crash is ignored
+when the journal is read back.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import os
+from typing import Any, Optional, TextIO
+
+from adventure import AdventureGame
+from event_logger import Event, CompactEventList
+
+# The number of lines written to a journal between forced writes to disk
+SYNC_EVERY = 16
+
+
+class EventJournal:
+    """An append-only journal file of game events.
+
+    Instance Attributes:
+        - filename: the name of the journal file
+        - sync_every: the number of lines written between forced writes to disk
+
+    Representation Invariants:
+        - self.sync_every > 0
+        - 0 <= self._unsynced < self.sync_every
+    """
+    # Private Instance Attributes:
+    #   - _file: the journal file, open for appending, or None once the journal is closed
+    #   - _unsynced: the number of lines written since the last forced write to disk
+    filename: str
+    sync_every: int
+    _file: Optional[TextIO]
+    _unsynced: int
+
+    def __init__(self, filename: str, sync_every: int = SYNC_EVERY) -> None:
+        """Open the journal with the given filename for appending, creating the file if it does not exist.
+
+        Preconditions:
+            - sync_every > 0
+        """
+        self.filename = filename
+        self.sync_every = sync_every
+        self._file = open(filename, 'a', encoding='utf-8')
+        self._unsynced = 0
+
+    def write_header(self, game_data_file: str, initial_location_id: int, max_moves: int) -> None:
+        """Write the line describing the game this journal is for, and force it onto the disk.
+
+        Preconditions:
+            - nothing has been written to this journal yet
+        """
+        self.write({'game': game_data_file, 'start': initial_location_id, 'max_moves': max_moves})
+        self.sync()
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append the given record to this journal as one line, forcing it onto the disk if sync_every lines have
+        been written since the last time.
+
+        Preconditions:
+            - this journal is not closed
+        """
+        self._file.write(json.dumps(record) + '\n')
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Force every line written to this journal so far onto the disk."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self) -> None:
+        """Force every line written so far onto the disk and close this journal. Closing twice does nothing."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> EventJournal:
+        """Return this journal, for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this journal at the end of a with statement."""
+        self.close()
+
+
+class JournaledEventList(CompactEventList):
+    """A compact game event list that also appends every change to it to a journal.
+
+    Instance Attributes:
+        - journal: the journal that changes are written to, or None to not write them anywhere
+    """
+    journal: Optional[EventJournal]
+
+    def __init__(self, journal: Optional[EventJournal] = None) -> None:
+        """Initialize a new empty event list that writes its changes to the given journal."""
+        super().__init__()
+        self.journal = journal
+
+    def add_event(self, event: Event, command: Optional[str] = None) -> None:
+        """
+        Add the given new event to the end of this event list, and record it in the journal.
+        The given command is the command which was used to reach this new event, or None if this is the first
+        event in the game.
+        """
+        super().add_event(event, command)
+        if self.journal is not None:
+            self.journal.write({'id': event.id_num, 'command': command})
+
+    def remove_last_event(self) -> None:
+        """
+        Remove the last event from this event list, and record the removal in the journal.
+        If the list is empty, do nothing.
+        """
+        if not self.is_empty():
+            super().remove_last_event()
+            if self.journal is not None:
+                self.journal.write({'remove': True})
+
+
+def read_journal(filename: str) -> tuple[list[dict[str, Any]], int]:
+    """Return (1) the records in the given journal file, in order, and (2) the number of bytes at the start of the
+    file that hold them.
+
+    A last line that was cut off (because the game crashed while writing it) is left out.
+    """
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    records = []
+    size = 0
+    for line in data.splitlines(keepends=True):
+        if not line.endswith(b'\n'):
+            break
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            break
+        size += len(line)
+    return records, size
+
+
+def replay(filename: str, resume: bool = False) -> tuple[AdventureGame, JournaledEventList]:
+    """Rebuild the game recorded in the given journal file by applying its commands to a new game, and return the
+    game and its event log.
+
+    An event reached without a command (such as the one added when a game is resumed) changes nothing. Removing an
+    event that a command was applied for undoes that command (see AdventureGame.undo), and removing any other event
+    only removes it from the log. The returned game can undo every command still in the log. If resume is True, a
+    line cut off at the end of the file is dropped and the returned log keeps appending to the journal; otherwise
+    the returned log has no journal.
+
+    Raise ValueError if the journal is empty or its events do not match what the game does with its commands.
+
+    >>> import tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'game.jsonl')
+    >>> game = AdventureGame('game_data.json', 1)
+    >>> log = JournaledEventList(EventJournal(filename))
+    >>> log.journal.write_header('game_data.json', 1, game.max_moves)
+    >>> results = game.run_batch(["take t_card", "go north", "go east"], log)
+    >>> log.add_event(Event(3, game.get_location().long_description))  # Like a cancelled quit
+    >>> log.journal.close()
+    >>> game, log = replay(filename)
+    >>> game.current_location_id, log.get_id_log(), game.has_item(4), log.journal is None
+    (3, [1, 1, 2, 3, 3], True, True)
+
+    A line cut off by a crash is dropped when the game is resumed, and the journal continues after the last whole
+    line:
+
+    >>> with open(filename, 'a') as f:
+    ...     _ = f.write('{"id": 2, "comm')
+    >>> game, log = replay(filename, resume=True)
+    >>> log.get_id_log()
+    [1, 1, 2, 3, 3]
+    >>> game.run_batch(["go west"], log)[0].command
+    'go west'
+    >>> log.journal.close()
+    >>> records, _ = read_journal(filename)
+    >>> records[-1]
+    {'id': 2, 'command': 'go west'}
+
+    Commands undone with their events (see AdventureGame.undo) are undone in the replay too:
+
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'undone.jsonl')
+    >>> game = AdventureGame('game_data.json', 1, undo=True)
+    >>> log = JournaledEventList(EventJournal(filename))
+    >>> log.journal.write_header('game_data.json', 1, game.max_moves)
+    >>> results = game.run_batch(["take t_card", "go north"], log)
+    >>> game.undo(log) and game.undo(log)
+    True
+    >>> log.journal.close()
+    >>> replayed, replayed_log = replay(filename)
+    >>> (replayed.current_location_id, replayed.inventory, replayed.moves, replayed_log.get_id_log())
+    (1, [], 0, [1])
+    >>> (game.current_location_id, game.inventory, game.moves, log.get_id_log())
+    (1, [], 0, [1])
+
+    A journal that does not match its game is rejected:
+
+    >>> with open(filename, 'w') as f:
+    ...     print('{"game": "game_data.json", "start": 1, "max_moves": 30}', file=f)
+    ...     print('{"id": 1, "command": null}', file=f)
+    ...     print('{"id": 5, "command": "go north"}', file=f)
+    >>> replay(filename)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ValueError: ... expected location 5 after 'go north', but the game is at location 2
+    """
+    records, size = read_journal(filename)
+    if not records or 'game' not in records[0]:
+        raise ValueError(f"{filename} is not a game journal")
+    header = records[0]
+
+    game = AdventureGame(header['game'], header['start'], undo=True)
+    game.max_moves = header['max_moves']
+    log = JournaledEventList()
+    # Whether a command was applied for each event in log, in order, so that removing it can undo the command
+    applied = []
+    for record in records[1:]:
+        if record.get('remove'):
+            if applied and applied.pop():
+                game.undo()
+            log.remove_last_event()
+            continue
+        command = record['command']
+        applied.append(command is not None and not log.is_empty())
+        if applied[-1]:
+            game.execute(command)
+        game.visit()
+        location = game.get_location()
+        if location.id_num != record['id']:
+            raise ValueError(f"{filename} does not match its game: expected location {record['id']} after "
+                             f"{command!r}, but the game is at location {location.id_num}")
+        log.add_event(Event(location.id_num, location.long_description), command)
+
+    if resume:
+        with open(filename, 'r+b') as f:
+            f.truncate(size)
+        log.journal = EventJournal(filename)
+    return game, log
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    pass
@@ -21,8 +21,10 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
+from weakref import WeakValueDictionary
 
 
 # Note: We have completed the Event class for you. Do NOT modify it here for A1.
@@ -49,6 +51,9 @@ class EventList:
     """
     A linked list of game events.
 
+    Alongside the links, the list keeps an index of its events by position and by location, so that its length,
+    the k-th event, and the events at a given location can be found without walking the list.
+
     Instance Attributes:
         - first: The first Event in this linked list, or None if the list is empty
         - last: The last Event in this linked list, or None if the list is empty
@@ -59,9 +64,16 @@ class EventList:
         - If first is not None, first.prev is None
         - If last is not None, last.next is None
         - All events form a continuous bidirectional linked chain from first to last 
+        - self._events lists the events of the chain from first to last
+        - all(self._events[k].id_num == loc_id for loc_id in self._positions for k in self._positions[loc_id])
     """
+    # Private Instance Attributes:
+    #   - _events: the events in this list, in order (so the k-th event is _events[k])
+    #   - _positions: a mapping from location id to the positions of the events at that location, in increasing order
     first: Optional[Event]
     last: Optional[Event]
+    _events: list[Event]
+    _positions: dict[int, list[int]]
 
     # Note: You may ADD parameters/attributes/methods to this class as you see fit.
     # But do not rename or remove any existing methods/attributes in this class
@@ -71,13 +83,41 @@ class EventList:
 
         self.first = None
         self.last = None
+        self._events = []
+        self._positions = {}
 
     def display_events(self) -> None:
         """Display all events in chronological order."""
-        curr = self.first
-        while curr:
+        for curr in self._events:
             print(f"Location: {curr.id_num}, Command: {curr.next_command}")
-            curr = curr.next
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+        return len(self._events)
+
+    def get_event(self, k: int) -> Event:
+        """Return the k-th event in this list (counting from 0). Negative k counts back from the last event.
+
+        Preconditions:
+            - -len(self) <= k < len(self)
+        """
+        return self._events[k]
+
+    def get_events(self, start: int, stop: int) -> list[Event]:
+        """Return the events from position start up to (but not including) position stop, in order."""
+        return self._events[start:stop]
+
+    def events_at(self, location_id: int) -> list[Event]:
+        """Return all events at the location with the given id, in order."""
+        return [self._events[k] for k in self._positions.get(location_id, [])]
+
+    def count_at(self, location_id: int) -> int:
+        """Return the number of events at the location with the given id."""
+        return len(self._positions.get(location_id, []))
+
+    def positions_at(self, location_id: int) -> list[int]:
+        """Return the positions of the events at the location with the given id, in increasing order."""
+        return list(self._positions.get(location_id, []))
 
     # TODO: Complete the methods below, based on the given descriptions. Do NOT change any of their specifications.
     #  That is, the function headers (parameters, return type, etc.) must NOT be changed.
@@ -101,7 +141,9 @@ class EventList:
                 self.last.next = event
                 event.prev = self.last
             self.last = event
-        
+        self._positions.setdefault(event.id_num, []).append(len(self._events))
+        self._events.append(event)
+
     def remove_last_event(self) -> None:
         """
         Remove the last event from this event list.
@@ -110,7 +152,14 @@ class EventList:
         # Hint: The <next_command> and <next> attributes for the new last event should be updated as needed
         if self.is_empty():
             return
-        elif self.last is not None and self.last.prev is None:
+
+        removed = self._events.pop()
+        positions = self._positions[removed.id_num]
+        positions.pop()
+        if not positions:
+            del self._positions[removed.id_num]
+
+        if self.last is not None and self.last.prev is None:
             # Only one event in the list
             self.first = None
             self.last = None
@@ -121,15 +170,285 @@ class EventList:
                 if self.last is not None:
                     self.last.next = None
                     self.last.next_command = None
-        
+
+    def get_id_log(self) -> list[int]:
+        """Return a list of all location IDs visited for each event in this list, in sequence."""
+        return [event.id_num for event in self._events]
+
+
+class CompactEventList(EventList):
+    """
+    A game event list that stores its events in compact arrays instead of as linked Event objects.
+
+    Each event takes a few bytes: its location id, and the id of the command that reached it in a table where each
+    distinct command is stored once. Each location's description is also stored once. Event objects are only
+    created when they are asked for (through first, last, get_event, and so on), so a long game's log stays small.
+
+    A CompactEventList can be used wherever an EventList is. The events it returns are read-only views of its
+    arrays (see _EventView), linked to each other through next and prev like the events of an EventList, and the
+    same position gives the same object for as long as that object is in use:
+
+    >>> compact = CompactEventList()
+    >>> compact.add_event(Event(1, "Dorm"))
+    >>> compact.add_event(Event(2, "Hallway"), "go north")
+    >>> event = compact.first
+    >>> while event is not compact.last:
+    ...     print(event.id_num, event.next_command)
+    ...     event = event.next
+    1 go north
+    >>> event.next is None and event.prev.next is event
+    True
+
+    A CompactEventList gives the same results as an EventList with the same events:
+
+    >>> linked, compact = EventList(), CompactEventList()
+    >>> for log in (linked, compact):
+    ...     log.add_event(Event(1, "Dorm"))
+    ...     log.add_event(Event(2, "Hallway"), "go north")
+    ...     log.add_event(Event(2, "Hallway"))  # Reached without a command, like a cancelled quit
+    ...     log.add_event(Event(3, "UC"), "go east")
+    >>> compact.display_events()
+    Location: 1, Command: go north
+    Location: 2, Command: None
+    Location: 2, Command: go east
+    Location: 3, Command: None
+    >>> linked.display_events()
+    Location: 1, Command: go north
+    Location: 2, Command: None
+    Location: 2, Command: go east
+    Location: 3, Command: None
+    >>> def fields(event: Event) -> tuple:
+    ...     return event.id_num, event.description, event.next_command
+    >>> [fields(compact.get_event(k)) == fields(linked.get_event(k)) for k in (0, 1, -1, -4)]
+    [True, True, True, True]
+    >>> [fields(e) for e in compact.get_events(1, 3)] == [fields(e) for e in linked.get_events(1, 3)]
+    True
+    >>> compact.get_event(4)
+    Traceback (most recent call last):
+    IndexError: event index out of range
+    >>> CompactEventList().get_event(0)
+    Traceback (most recent call last):
+    IndexError: event index out of range
+    >>> for log in (linked, compact):
+    ...     log.remove_last_event()
+    >>> fields(compact.last) == fields(linked.last) == (2, "Hallway", None)
+    True
+    >>> compact.get_id_log() == linked.get_id_log() == [1, 2, 2]
+    True
+
+    Instance Attributes:
+        - first: A view of the first event in this list, or None if the list is empty
+        - last: A view of the last event in this list, or None if the list is empty
+
+    Representation Invariants:
+        - len(self._location_ids) == len(self._command_ids)
+        - len(self._command_ids) == 0 or self._command_ids[0] == -1
+        - all(-1 <= c < len(self._commands) for c in self._command_ids)
+        - all(self._command_table[self._commands[c]] == c for c in range(len(self._commands)))
+        - all(loc_id in self._descriptions for loc_id in self._location_ids)
+    """
+    # Private Instance Attributes:
+    #   - _location_ids: the location id of each event, in order
+    #   - _command_ids: the id of the command used to reach each event, in order (-1 for the first event, or for an
+    #                   event reached without a command)
+    #   - _commands: every distinct command used so far, where the command with id c is _commands[c]
+    #   - _command_table: a mapping from each command in _commands to its id
+    #   - _descriptions: a mapping from location id to the description of the events at that location
+    #   - _positions: a mapping from location id to the positions of the events at that location, in increasing order
+    #   - _views: the views of events in this list that are still in use somewhere, by position
+    _location_ids: array
+    _command_ids: array
+    _commands: list[str]
+    _command_table: dict[str, int]
+    _descriptions: dict[int, str]
+    _positions: dict[int, array]
+    _views: WeakValueDictionary[int, _EventView]
+
+    def __init__(self) -> None:
+        """Initialize a new empty event list."""
+        # EventList.__init__ is not called, since first and last are computed from the arrays
+        self._location_ids = array('i')
+        self._command_ids = array('i')
+        self._commands = []
+        self._command_table = {}
+        self._descriptions = {}
+        self._positions = {}
+        self._views = WeakValueDictionary()
+
+    @property
+    def first(self) -> Optional[Event]:
+        """A view of the first event in this list, or None if the list is empty."""
+        return self._materialize(0) if self._location_ids else None
+
+    @property
+    def last(self) -> Optional[Event]:
+        """A view of the last event in this list, or None if the list is empty."""
+        return self._materialize(len(self._location_ids) - 1) if self._location_ids else None
+
+    def _materialize(self, k: int) -> Event:
+        """Return the view of the k-th event in this list, creating it if it is not in use anywhere.
+
+        Preconditions:
+            - 0 <= k < len(self)
+        """
+        view = self._views.get(k)
+        if view is None:
+            view = _EventView(self, k)
+            self._views[k] = view
+        return view
+
+    def _next_command(self, k: int) -> Optional[str]:
+        """Return the command used to leave the k-th event in this list, or None if it is the last event or was
+        left without a command.
+
+        Preconditions:
+            - 0 <= k < len(self)
+        """
+        if k + 1 == len(self._command_ids) or self._command_ids[k + 1] == -1:
+            return None
+        return self._commands[self._command_ids[k + 1]]
+
+    def display_events(self) -> None:
+        """Display all events in chronological order."""
+        for k, loc_id in enumerate(self._location_ids):
+            print(f"Location: {loc_id}, Command: {self._next_command(k)}")
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+        return len(self._location_ids)
+
+    def get_event(self, k: int) -> Event:
+        """Return a view of the k-th event in this list (counting from 0). Negative k counts back from the last event.
+
+        Raise IndexError if there is no k-th event, as EventList does.
+        """
+        n = len(self._location_ids)
+        if not -n <= k < n:
+            raise IndexError("event index out of range")
+        return self._materialize(k % n)
+
+    def get_events(self, start: int, stop: int) -> list[Event]:
+        """Return views of the events from position start up to (but not including) position stop, in order."""
+        return [self._materialize(k) for k in range(*slice(start, stop).indices(len(self._location_ids)))]
+
+    def events_at(self, location_id: int) -> list[Event]:
+        """Return views of all events at the location with the given id, in order."""
+        return [self._materialize(k) for k in self._positions.get(location_id, [])]
+
+    def count_at(self, location_id: int) -> int:
+        """Return the number of events at the location with the given id."""
+        return len(self._positions.get(location_id, []))
+
+    def positions_at(self, location_id: int) -> list[int]:
+        """Return the positions of the events at the location with the given id, in increasing order."""
+        return list(self._positions.get(location_id, []))
+
+    def is_empty(self) -> bool:
+        """Return whether this event list is empty."""
+        return not self._location_ids
+
+    def add_event(self, event: Event, command: Optional[str] = None) -> None:
+        """
+        Add the given new event to the end of this event list.
+        The given command is the command which was used to reach this new event, or None if this is the first
+        event in the game.
+
+        Only the event's location id and description are kept; the event object itself is not stored.
+        """
+        if command is None or self.is_empty():
+            command_id = -1
+        else:
+            command_id = self._command_table.get(command, -1)
+            if command_id == -1:
+                command_id = len(self._commands)
+                self._commands.append(command)
+                self._command_table[command] = command_id
+
+        self._descriptions.setdefault(event.id_num, event.description)
+        self._positions.setdefault(event.id_num, array('i')).append(len(self._location_ids))
+        self._location_ids.append(event.id_num)
+        self._command_ids.append(command_id)
+
+    def remove_last_event(self) -> None:
+        """
+        Remove the last event from this event list.
+        If the list is empty, do nothing.
+        """
+        if self.is_empty():
+            return
+
+        loc_id = self._location_ids.pop()
+        self._command_ids.pop()
+        self._views.pop(len(self._location_ids), None)
+        positions = self._positions[loc_id]
+        positions.pop()
+        if not positions:
+            del self._positions[loc_id]
+
     def get_id_log(self) -> list[int]:
         """Return a list of all location IDs visited for each event in this list, in sequence."""
-        log = []
-        curr = self.first
-        while curr:
-            log.append(curr.id_num)
-            curr = curr.next
-        return log
+        return self._location_ids.tolist()
+
+
+class _EventView(Event):
+    """An event of a CompactEventList, whose attributes are read from the list's arrays when they are looked up.
+
+    Its next_command, next and prev therefore follow later changes to the list, as they do for the events of an
+    EventList. A view cannot be changed, and should not be used once its event is removed from its list.
+    """
+    # Private Instance Attributes:
+    #   - _log: the list this is an event of
+    #   - _position: the position of this event in _log
+    #   - _id_num: the id of this event's location
+    _log: CompactEventList
+    _position: int
+    _id_num: int
+
+    def __init__(self, log: CompactEventList, position: int) -> None:
+        """Initialize a view of the event at the given position of the given list.
+
+        Preconditions:
+            - 0 <= position < len(log)
+        """
+        # Event.__init__ is not called, since every attribute is read from log
+        self._log = log
+        self._position = position
+        self._id_num = log._location_ids[position]
+
+    @property
+    def id_num(self) -> int:
+        """The id of this event's location."""
+        return self._id_num
+
+    @property
+    def description(self) -> str:
+        """The long description of this event's location."""
+        return self._log._descriptions[self._id_num]
+
+    @property
+    def next_command(self) -> Optional[str]:
+        """The command that leads from this event to the next, or None if there is none."""
+        return self._log._next_command(self._position) if self._position < len(self._log) else None
+
+    @property
+    def next(self) -> Optional[Event]:
+        """The next event in the list, or None if this is the last event."""
+        return self._log._materialize(self._position + 1) if self._position + 1 < len(self._log) else None
+
+    @property
+    def prev(self) -> Optional[Event]:
+        """The previous event in the list, or None if this is the first event."""
+        return self._log._materialize(self._position - 1) if 0 < self._position <= len(self._log) else None
+
+    def __eq__(self, other: Any) -> bool:
+        """Return whether other is a view of the same event of the same list."""
+        return isinstance(other, _EventView) and other._log is self._log and other._position == self._position
+
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        """Return a representation of this event, without its neighbours."""
+        return f"Event(id_num={self.id_num!r}, description={self.description!r}, next_command={self.next_command!r})"
 
 
 if __name__ == '__main__':
@@ -139,6 +458,6 @@ if __name__ == '__main__':
     import python_ta
     python_ta.check_all(config={
         'max-line-length': 120,
-        'allowed-io': ['EventList.display_events'],
+        'allowed-io': ['EventList.display_events', 'CompactEventList.display_events'],
         'disable': ['R1705', 'static_type_checker']
     })
@@ -0,0 +1,121 @@
+"""CSC111 Project 1: Text Adventure Game - Scripted Game Client
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module plays scripted games against a game server (see game_server.py), to try out the server locally
+and to measure how many sessions it can handle at once.
+
+A script file has one command per line. Run it from the command line with:
+
+    python game_client.py script.txt --port 8111 --sessions 1000
+
+which plays the script in 1000 sessions at the same time and reports how long they took. The replies of the first
+session are printed as well.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import sys
+import time
+from typing import Optional
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Optional[list[str]]:
+    """Return the lines of the next reply from the server (see game_server.encode_reply), or None if the server
+    closed the connection first."""
+    header = await reader.readline()
+    if not header.endswith(b'\n'):
+        return None
+    try:
+        body = await reader.readexactly(int(header))
+    except asyncio.IncompleteReadError:
+        return None
+    return body.decode('utf-8').split('\n')[:-1]
+
+
+async def play_script(commands: list[str], host: str = 'localhost', port: int = 8111,
+                      unix_path: Optional[str] = None, timeout: float = 30.0) -> list[list[str]]:
+    """Connect to the server, send the given commands one at a time (waiting for each reply), and return every
+    reply received, starting with the welcome. Stop early if the server closes the connection.
+
+    Raise asyncio.TimeoutError if the server takes longer than timeout seconds to reply.
+    """
+    if unix_path is not None:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    replies = []
+    try:
+        reply = await asyncio.wait_for(read_reply(reader), timeout)
+        for command in commands:
+            if reply is None:
+                break
+            replies.append(reply)
+            writer.write(command.encode('utf-8') + b'\n')
+            await writer.drain()
+            reply = await asyncio.wait_for(read_reply(reader), timeout)
+        if reply is not None:
+            replies.append(reply)
+    finally:
+        writer.close()
+    return replies
+
+
+async def play_sessions(commands: list[str], sessions: int, host: str = 'localhost', port: int = 8111,
+                        unix_path: Optional[str] = None) -> list[list[list[str]]]:
+    """Play the given commands in the given number of sessions at the same time, and return the replies of each.
+
+    Preconditions:
+        - sessions > 0
+    """
+    return list(await asyncio.gather(*(play_script(commands, host, port, unix_path) for _ in range(sessions))))
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Play a script file against a running server from the command line."""
+    parser = argparse.ArgumentParser(description="Play a scripted game against a game server.")
+    parser.add_argument('script', help="script file, one command per line")
+    parser.add_argument('--host', default='localhost', help="server host")
+    parser.add_argument('--port', type=int, default=8111, help="server port")
+    parser.add_argument('--unix', default=None, help="connect to this Unix socket path instead of TCP")
+    parser.add_argument('--sessions', type=int, default=1, help="number of sessions to play at the same time")
+    args = parser.parse_args(argv)
+
+    with open(args.script, 'r') as f:
+        commands = [line.strip() for line in f if line.strip()]
+
+    start = time.perf_counter()
+    results = asyncio.run(play_sessions(commands, args.sessions, args.host, args.port, args.unix))
+    elapsed = time.perf_counter() - start
+
+    for reply in results[0]:
+        print('\n'.join(reply))
+        print()
+    print(f"Played {args.sessions} sessions of {len(commands)} commands in {elapsed:.2f}s "
+          f"({args.sessions * len(commands) / elapsed:.0f} commands per second)")
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    main(sys.argv[1:])
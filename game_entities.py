@@ -18,10 +18,11 @@ please consult our Course Syllabus.
 
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
+from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """A location in our text adventure game world.
 
@@ -31,7 +32,7 @@ class Location:
         - brief_description: a brief description of the location
         - long_description: a detailed description of the location
         - available_commands: a dictionary of commands available at this location
-        - items: a list of items available at this location
+        - items: the names of the items available at this location
         - visited: whether the player has visited this location
         - locked: whether the location is locked and requires a key to enter
         - key_id: the ID of the item required to unlock this location (-1 if no key is needed)
@@ -41,7 +42,7 @@ class Location:
         - name is a non-empty string
         - brief_description and long_description are non-empty strings
         - available_commands is a dictionary of valid commands
-        - items is a list of strings
+        - items is a list of strings, or a tuple of strings for a location in a shared world template
         - visited is True or False
         - locked is True or False
     """
@@ -51,16 +52,18 @@ class Location:
     brief_description: str
     long_description: str
     available_commands: dict[str, int]
-    items: list[str]
+    items: list[str] | tuple[str, ...]
     visited: bool = False
     locked: bool = False
     key_id: int = -1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Item:
     """An item in our text adventure game world.
 
+    Items are never changed during a game, so the same Item objects are shared by every game played in a world.
+
     Instance Attributes:
         - id: unique identifier for this item
         - name: the name of the item
@@ -68,6 +71,8 @@ class Item:
         - can_take: whether the player is allowed to take this item
         - target_position: the location ID where this item should be delivered
         - target_points: the points awarded for delivering this item
+        - aliases: other names the player can use to refer to this item
+        - secret_ending: whether delivering this item to its target position ends the game with the secret ending
 
     Representation Invariants:
         - id is a unique identifier
@@ -83,6 +88,8 @@ class Item:
     can_take: bool
     target_position: int
     target_points: int
+    aliases: tuple[str, ...] = ()
+    secret_ending: bool = False
 
 
 # Note: Other entities you may want to add, depending on your game plan:
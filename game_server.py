@@ -0,0 +1,272 @@
+"""CSC111 Project 1: Text Adventure Game - Game Server
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module runs many games at once in a single process, one for every player connected over TCP (or a Unix
+socket), using asyncio. Each connection is a separate game session driven by AdventureGame.execute.
+
+The client sends one command per line, and the server answers every command with a reply: the lines of feedback the
+command produced (and the screen for the player's new location, after a move). The server also sends one reply (the
+welcome and the screen for the starting location) as soon as a client connects. Each reply is sent as a line holding
+the length of the reply in bytes, followed by the reply itself (every line of it ending in a newline), so that a
+reply may contain any line at all. The connection is closed once the game ends, or when the client sends nothing
+for idle_timeout seconds.
+
+The "stats" command shows the statistics of the player's own session, rather than the metrics of the whole server
+(see metrics.py), which only whoever runs the server can read.
+
+Run the server from the command line with:
+
+    python game_server.py --port 8111 --data game_data.json
+
+and connect to it with game_client.py (or any line-based client, like netcat).
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import sys
+import time
+from typing import Optional
+
+from adventure import AdventureGame
+from event_logger import CompactEventList, Event
+from metrics import METRICS, enable_from_environment
+from renderer import TurnRenderer
+from world_validator import validated_world_file
+from world_template import load_world
+
+# The longest command line (in bytes) the server accepts
+MAX_LINE = 1024
+
+# The number of bytes of replies that may wait to be sent to one client before the server stops reading its commands
+WRITE_BUFFER_HIGH = 64 * 1024
+
+# The number of connections that may wait to be accepted. Since the server speaks first, a connection dropped from a
+# full queue would leave its client waiting forever, so this is large enough for thousands of clients at once.
+BACKLOG = 4096
+
+
+class GameServer:
+    """A server that hosts one game session for every connected client.
+
+    Every session shares the same world template, so a session only costs the state its own game has changed.
+
+    >>> import os, tempfile
+    >>> from game_client import play_script
+    >>> async def play(commands: list[str]) -> list[list[str]]:
+    ...     unix_path = os.path.join(tempfile.mkdtemp(), 'game.sock')
+    ...     server = await asyncio.start_unix_server(GameServer('game_data.json').handle_client, unix_path)
+    ...     async with server:
+    ...         return await play_script(commands, unix_path=unix_path)
+    >>> replies = asyncio.run(play(["dance", "go north", "log", "stats", "quit"]))
+    >>> replies[1]
+    ['That was an invalid option; try again.']
+    >>> replies[3]  # The invalid command is not in the log
+    ['Location: 1, Command: go north', 'Location: 2, Command: log', 'Location: 2, Command: None']
+    >>> replies[4][1:]  # Only this session's statistics
+    ['  events logged: 4', '  moves: 1/20', '  score: 0']
+
+    Instance Attributes:
+        - game_data_file: the game data file every session is played in
+        - initial_location_id: the id of the location every session starts at
+        - idle_timeout: the number of seconds a session may go without a command (or without reading its replies)
+          before it is closed
+        - max_sessions: the largest number of sessions open at once; later clients are turned away
+        - sessions: the number of sessions currently open
+        - total_sessions: the number of sessions opened since the server started
+        - renderer: the renderer of the screens sent to players, shared by every session
+
+    Representation Invariants:
+        - self.idle_timeout > 0
+        - 0 <= self.sessions <= self.max_sessions
+        - self.sessions <= self.total_sessions
+    """
+    game_data_file: str
+    initial_location_id: int
+    idle_timeout: float
+    max_sessions: int
+    sessions: int
+    total_sessions: int
+    renderer: TurnRenderer
+
+    def __init__(self, game_data_file: str, initial_location_id: int = 1, idle_timeout: float = 300.0,
+                 max_sessions: int = 10000) -> None:
+        """Initialize a new server for the given game. The world is loaded now, so that the first client does not
+        wait for it.
+
+        Preconditions:
+            - game_data_file is the filename of a valid game data file
+            - idle_timeout > 0
+            - max_sessions > 0
+        """
+        self.game_data_file = game_data_file
+        self.initial_location_id = initial_location_id
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.sessions = 0
+        self.total_sessions = 0
+        self.renderer = TurnRenderer()
+        load_world(game_data_file)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Play one game session with the client on the other end of the given streams, closing the connection
+        when the session ends."""
+        if self.sessions >= self.max_sessions:
+            writer.write(encode_reply(["The server is full. Try again later."]))
+            writer.close()
+            return
+
+        self.sessions += 1
+        self.total_sessions += 1
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH)
+        try:
+            await self._play(reader, writer)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def _play(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Run the game loop of one session until the game ends, the client leaves, or the session times out."""
+        game = AdventureGame(self.game_data_file, self.initial_location_id)
+        started = time.perf_counter()
+        log = CompactEventList()
+        location = game.get_location()
+        log.add_event(Event(location.id_num, location.long_description))
+        await self._send(writer, ["Welcome to the CSC111 adventure! Type 'help' for the list of commands.",
+                                  self.renderer.render(game, game.visit()).strip('\n')])
+
+        while game.ongoing:
+            try:
+                line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+            except asyncio.TimeoutError:
+                await self._send(writer, ["You were idle for too long. Goodbye."])
+                return
+            except ValueError:
+                # The line was longer than MAX_LINE
+                await self._send(writer, ["That command is too long. Goodbye."])
+                return
+            if not line:
+                return  # The client disconnected
+
+            command = line.decode('utf-8', errors='replace').strip()
+            if not command:
+                await self._send(writer, [])
+                continue
+
+            previous_location_id = game.current_location_id
+            result = game.execute(command)
+            first_visit = game.visit()
+            if result.valid:
+                location = game.get_location()
+                log.add_event(Event(location.id_num, location.long_description), result.command)
+                if METRICS.enabled:
+                    METRICS.count("events_logged")
+
+            lines = list(result.messages)
+            if result.action == "stats":
+                lines = session_stats_lines(game, len(log), time.perf_counter() - started)
+            elif result.action == "log":
+                lines.extend(f"Location: {event.id_num}, Command: {event.next_command}"
+                             for event in log.get_events(0, len(log)))
+            if game.ongoing and game.current_location_id != previous_location_id:
+                if METRICS.enabled:
+                    start = time.perf_counter()
+                    lines.append(self.renderer.render(game, first_visit).strip('\n'))
+                    METRICS.observe("render", time.perf_counter() - start)
+                else:
+                    lines.append(self.renderer.render(game, first_visit).strip('\n'))
+            await self._send(writer, lines)
+
+    async def _send(self, writer: asyncio.StreamWriter, lines: list[str]) -> None:
+        """Send the given lines to the client as one reply, and wait until the client has read enough of its replies
+        that the unsent ones fit under WRITE_BUFFER_HIGH.
+
+        Raise asyncio.TimeoutError if the client does not read them within idle_timeout seconds.
+        """
+        writer.write(encode_reply(lines))
+        await asyncio.wait_for(writer.drain(), self.idle_timeout)
+
+    async def serve(self, host: str = 'localhost', port: int = 8111, unix_path: Optional[str] = None) -> None:
+        """Accept clients on the given host and port (or on the Unix socket at unix_path, if given) until cancelled.
+        """
+        if unix_path is not None:
+            server = await asyncio.start_unix_server(self.handle_client, unix_path, limit=MAX_LINE, backlog=BACKLOG)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE, backlog=BACKLOG)
+        async with server:
+            await server.serve_forever()
+
+
+def encode_reply(lines: list[str]) -> bytes:
+    """Return the given lines as one reply to send to a client: a line with the length of the reply in bytes,
+    followed by the reply.
+
+    >>> encode_reply([">", "You move to location 2."])
+    b'26\\n>\\nYou move to location 2.\\n'
+    >>> encode_reply([])
+    b'0\\n'
+    """
+    body = ''.join(line + '\n' for line in lines).encode('utf-8')
+    return str(len(body)).encode('ascii') + b'\n' + body
+
+
+def session_stats_lines(game: AdventureGame, events: int, elapsed: float) -> list[str]:
+    """Return the lines of the "stats" reply of a session that has played the given game for elapsed seconds and
+    logged the given number of events."""
+    return [f"=== SESSION STATS ({elapsed:.1f}s) ===",
+            f"  events logged: {events}",
+            f"  moves: {game.moves}/{game.max_moves}",
+            f"  score: {game.score}"]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run a game server from the command line until it is interrupted."""
+    parser = argparse.ArgumentParser(description="Host adventure game sessions over TCP.")
+    parser.add_argument('--host', default='localhost', help="host to listen on")
+    parser.add_argument('--port', type=int, default=8111, help="port to listen on")
+    parser.add_argument('--unix', default=None, help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--data', default='game_data.json', help="game data file")
+    parser.add_argument('--start', type=int, default=1, help="initial location id")
+    parser.add_argument('--idle-timeout', type=float, default=300.0, help="seconds before an idle session is closed")
+    parser.add_argument('--max-sessions', type=int, default=10000, help="largest number of sessions at once")
+    args = parser.parse_args(argv)
+
+    # Set the ADVENTURE_METRICS environment variable to a file name to record metrics, written there at exit
+    enable_from_environment()
+    try:
+        game_data_file = validated_world_file(args.data, args.start)
+    except ValueError as error:
+        parser.exit(1, f"{error}\n")
+    server = GameServer(game_data_file, args.start, args.idle_timeout, args.max_sessions)
+    print(f"Serving {args.data} on {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    main(sys.argv[1:])
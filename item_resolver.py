@@ -0,0 +1,108 @@
+"""CSC111 Project 1: Text Adventure Game - Item Name Resolver
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the ItemResolver class, which works out which item the player means when they type the
+name of an item in a command like "take mug" or "examine usb".
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from typing import Optional
+
+from game_entities import Item
+
+
+class ItemResolver:
+    """A lookup table from everything a player may type to refer to an item, to that item.
+
+    A player can refer to an item by its name, by one of its aliases (from the game data file), or by any prefix of
+    at least MIN_PREFIX characters of a name or alias, as long as that prefix refers to only one item. Case is
+    ignored. Names and aliases are kept in sorted order, so the names and aliases starting with a prefix are next to
+    each other, and are found with two binary searches no matter how many items there are.
+
+    >>> mug = Item(3, "lucky_mug", "Your lucky mug.", True, 1, 20, ("mug",))
+    >>> charger = Item(2, "laptop_charger", "Your charger.", True, 1, 30, ("charger",))
+    >>> resolver = ItemResolver([mug, charger])
+    >>> resolver.resolve("Lucky_Mug") is mug
+    True
+    >>> resolver.resolve("mug") is mug
+    True
+    >>> resolver.resolve("lap") is charger
+    True
+    >>> resolver.resolve("l") is None  # Too short, and could mean either item
+    True
+    """
+    # Private Instance Attributes:
+    #   - _exact: a mapping from each name and alias (in lowercase) to the item it refers to
+    #   - _keys: every name and alias (in lowercase), in sorted order
+    #   - _items: the item each key in _keys refers to, in the same order
+    #   - _changes: the number of positions i, up to and including each position, where _items[i] is a different
+    #               item from _items[i - 1]. A run of keys refers to only one item exactly when this does not grow
+    #               along the run.
+    _exact: dict[str, Item]
+    _keys: list[str]
+    _items: list[Item]
+    _changes: array
+
+    MIN_PREFIX = 2
+
+    def __init__(self, items: list[Item]) -> None:
+        """Initialize a new resolver for the given items.
+
+        Preconditions:
+            - no two items have the same name or alias (ignoring case)
+        """
+        exact = {}
+        for item in items:
+            exact[item.name.lower()] = item
+            for alias in item.aliases:
+                exact[alias.lower()] = item
+        self._exact = exact
+        self._keys = sorted(exact)
+        self._items = [exact[key] for key in self._keys]
+
+        self._changes = array('i', [0]) * len(self._items)
+        for i in range(1, len(self._items)):
+            self._changes[i] = self._changes[i - 1] + (self._items[i] is not self._items[i - 1])
+
+    def resolve(self, query: str) -> Optional[Item]:
+        """Return the item that the given text refers to, or None if it does not refer to exactly one item."""
+        query = query.strip().lower()
+        # A full name or alias always wins over a prefix of some other name
+        item = self._exact.get(query)
+        if item is not None or len(query) < ItemResolver.MIN_PREFIX:
+            return item
+
+        # The keys starting with query are those from query up to (but not including) the first string after it
+        # that does not start with it, which is query with its last character increased by one
+        start = bisect_left(self._keys, query)
+        end = bisect_left(self._keys, query[:-1] + chr(ord(query[-1]) + 1), start)
+        if start == end or self._changes[end - 1] != self._changes[start]:
+            return None
+        return self._items[start]
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    import doctest
+    doctest.testmod()
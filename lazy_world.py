@@ -0,0 +1,240 @@
+"""CSC111 Project 1: Text Adventure Game - Lazy World Loader
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module loads very large game data files without parsing every location up front.
+
+The file is scanned once to find where each location's JSON object starts and ends (its byte offsets), and the
+offsets are saved next to the file (as <file>.locidx) so later runs can skip the scan. A Location object is only
+created the first time it is looked up, and only a bounded number of them are kept in memory at a time.
+
+Items are still parsed up front, since every game needs the full item indexes.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import mmap
+import os
+import re
+from array import array
+from typing import Iterator, Optional
+
+from game_entities import Location
+from world_template import CachedLocations, WorldTemplate, parse_item, parse_location
+
+# Matches a JSON string, and a run of characters that are neither in a string nor brackets
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_OTHER = rb'[^"{}\[\]]++'
+# Matches the next '{', '}', '[' or ']' that is not inside a string, skipping everything before it
+_STRUCTURE = re.compile(rb'(?:' + _STRING + rb'|' + _OTHER + rb')*+([{}\[\]])')
+# Matches a whole JSON object nested at most three levels deep (like a location, with its available_commands and
+# items), so that the end of each location can be found without looking at it one bracket at a time
+_FLAT = rb'(?:' + _STRING + rb'|' + _OTHER + rb')*+'
+_NESTED = rb'(?:' + _STRING + rb'|' + _OTHER + rb'|\{' + _FLAT + rb'\}|\[' + _FLAT + rb'\])*+'
+_OBJECT = re.compile(rb'\{(?:' + _STRING + rb'|' + _OTHER + rb'|\{' + _NESTED + rb'\}|\[' + _NESTED + rb'\])*+\}')
+# Matches the whitespace and comma between two elements of an array
+_SEPARATOR = re.compile(rb'\s*,?\s*')
+# Matches the "id" key of a location and its value
+_ID = re.compile(rb'"id"\s*:\s*(-?\d+)')
+
+# The file extension of a saved location index
+INDEX_SUFFIX = '.locidx'
+
+
+class LazyLocations(CachedLocations):
+    """A read-only mapping from location id to Location, which parses each location from the game data file only
+    when it is looked up, and keeps at most capacity parsed locations in memory (least recently used first out).
+
+    Representation Invariants:
+        - all(loc_id in self._positions for loc_id in self._cache)
+        - len(self._starts) == len(self._ends) == len(self._positions)
+    """
+    # Private Instance Attributes:
+    #   - _data: the contents of the game data file, memory-mapped
+    #   - _positions: a mapping from location id to the position of that location in the file (0 for the first
+    #                 location, 1 for the second, and so on)
+    #   - _starts, _ends: the start and end byte offsets in _data of the JSON object of the location at each position
+    _data: mmap.mmap
+    _positions: dict[int, int]
+    _starts: array
+    _ends: array
+
+    def __init__(self, data: mmap.mmap, ids: array, starts: array, ends: array, capacity: int) -> None:
+        """Initialize a new lazy mapping over the given file contents, where the location with id ids[i] is the JSON
+        object from starts[i] to ends[i].
+
+        Preconditions:
+            - len(ids) == len(starts) == len(ends)
+            - capacity > 0
+        """
+        super().__init__(capacity)
+        self._data = data
+        self._positions = dict(zip(ids, range(len(ids))))
+        self._starts = starts
+        self._ends = ends
+
+    def _load(self, loc_id: int) -> Location:
+        """Parse and return the location with the given id from the file.
+
+        Names and descriptions are not shared with other locations (see world_template.parse_location), since a
+        table of every string parsed so far would keep growing after the locations themselves left the cache.
+
+        Raise KeyError if there is no location with the given id.
+        """
+        position = self._positions[loc_id]
+        return parse_location(json.loads(self._data[self._starts[position]:self._ends[position]]))
+
+    def __contains__(self, loc_id: object) -> bool:
+        """Return whether there is a location with the given id, without parsing it."""
+        return loc_id in self._positions
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the ids of all locations, in file order."""
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        """Return the number of locations in the file."""
+        return len(self._positions)
+
+
+def _value_end(data: mmap.mmap, pos: int) -> int:
+    """Return the offset just after the JSON object or array that starts at the given offset of data.
+
+    Preconditions:
+        - data[pos:pos + 1] in {b'{', b'['}
+    """
+    depth = 0
+    match = _STRUCTURE.match(data, pos)
+    while match is not None:
+        depth += 1 if match.group(1) in b'{[' else -1
+        if depth == 0:
+            return match.end()
+        match = _STRUCTURE.match(data, match.end())
+    return len(data)
+
+
+def _scan_locations(data: mmap.mmap, pos: int) -> tuple[list[tuple[int, int]], int]:
+    """Return (1) the start and end offsets of each object in the array whose '[' is just before the given offset
+    of data, and (2) the offset just after the array's closing ']'."""
+    spans = []
+    pos = _SEPARATOR.match(data, pos).end()
+    while data[pos:pos + 1] != b']':
+        match = _OBJECT.match(data, pos)
+        end = match.end() if match is not None else _value_end(data, pos)
+        spans.append((pos, end))
+        pos = _SEPARATOR.match(data, end).end()
+    return spans, pos + 1
+
+
+def _scan_arrays(data: mmap.mmap) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """Scan the given game data once and return (1) the start and end offsets of each object in the top-level
+    "locations" array, and (2) the start and end offsets of the top-level "items" array.
+
+    Preconditions:
+        - data is a valid game data JSON file
+    """
+    location_spans = []
+    items_span = (0, 0)
+    depth = 0
+    pos = 0
+
+    match = _STRUCTURE.match(data, pos)
+    while match is not None:
+        char = match.group(1)
+        char_pos = match.end() - 1
+        pos = match.end()
+        if char in b'{[':
+            depth += 1
+            if depth == 2:
+                # The key of a top-level value is the last string before it
+                key_end = data.rfind(b'"', 0, char_pos)
+                key = data[data.rfind(b'"', 0, key_end) + 1:key_end]
+                if key == b'locations':
+                    location_spans, pos = _scan_locations(data, pos)
+                    depth -= 1
+                else:
+                    pos = _value_end(data, char_pos)
+                    depth -= 1
+                    if key == b'items':
+                        items_span = (char_pos, pos)
+        else:
+            depth -= 1
+        match = _STRUCTURE.match(data, pos)
+
+    return location_spans, items_span
+
+
+def _read_index(index_file: str, version: tuple[int, int]) -> Optional[array]:
+    """Return the values saved in the given index file (see _write_index), or None if it is missing or was saved for
+    a different version of the game data file."""
+    if not os.path.exists(index_file):
+        return None
+    values = array('q')
+    with open(index_file, 'rb') as f:
+        values.frombytes(f.read())
+    if len(values) < 4 or (values[0], values[1]) != version:
+        return None
+    return values
+
+
+def _write_index(index_file: str, values: array) -> None:
+    """Save the given index values to the given index file. Nothing is saved if the file cannot be written (for
+    example, in a read-only directory).
+
+    The values are the game data file's modification time and size, the start and end offsets of its items array,
+    and then the id, start offset and end offset of each location in turn.
+    """
+    try:
+        with open(index_file, 'wb') as f:
+            f.write(values.tobytes())
+    except OSError:
+        pass
+
+
+def load_lazy_world(filename: str, capacity: int = 4096) -> WorldTemplate:
+    """Return a world template for the given game data file whose locations are parsed on first access, keeping
+    at most capacity of them in memory.
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON file
+        - capacity > 0
+    """
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    stat = os.stat(filename)
+    version = (stat.st_mtime_ns, stat.st_size)
+    index_file = filename + INDEX_SUFFIX
+    values = _read_index(index_file, version)
+    if values is None:
+        location_spans, items_span = _scan_arrays(data)
+        values = array('q', version + items_span)
+        for start, end in location_spans:
+            values.extend((int(_ID.search(data, start, end).group(1)), start, end))
+        _write_index(index_file, values)
+
+    items = [parse_item(item_data) for item_data in json.loads(data[values[2]:values[3]])]
+    return WorldTemplate(LazyLocations(data, values[4::3], values[5::3], values[6::3], capacity), items)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    pass
@@ -0,0 +1,223 @@
+"""CSC111 Project 1: Text Adventure Game - Metrics
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the metrics registry that the game records timings and counts in, to find out where the
+time in a turn goes (logging the event, drawing the screen, parsing and applying the command, and so on).
+
+Metrics are off by default, and recording a metric while they are off does nothing, so the code that records them
+can stay in place. Turn them on by setting the ADVENTURE_METRICS environment variable to the name of a file:
+
+    ADVENTURE_METRICS=metrics.json python adventure.py
+
+The metrics are then written to that file as JSON when the program exits, and the "stats" command shows them
+during a game.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import atexit
+import json
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Optional
+
+# The upper bounds of the histogram buckets, in seconds: 1 microsecond, 2 microseconds, 4 microseconds, and so on,
+# up to about 17 seconds. The last bucket holds everything slower.
+BUCKET_BOUNDS = [2 ** i / 1_000_000 for i in range(25)]
+
+# The environment variable that turns metrics on, naming the file to write them to
+METRICS_ENV = 'ADVENTURE_METRICS'
+
+
+class Histogram:
+    """A summary of many measurements of one phase, in seconds.
+
+    Each measurement is counted in the first bucket whose bound (in BUCKET_BOUNDS) it does not exceed, so
+    percentiles are only known to within a factor of two.
+
+    >>> histogram = Histogram()
+    >>> for seconds in [0.000001, 0.000003, 0.000003, 0.001]:
+    ...     histogram.observe(seconds)
+    >>> histogram.count
+    4
+    >>> histogram.percentile(50)  # 3 microseconds, in the bucket up to 4 microseconds
+    4e-06
+
+    Instance Attributes:
+        - count: the number of measurements
+        - total: the sum of the measurements
+        - minimum, maximum: the smallest and largest measurement (0.0 if there are none)
+        - buckets: the number of measurements in each bucket
+
+    Representation Invariants:
+        - self.count == sum(self.buckets)
+        - len(self.buckets) == len(BUCKET_BOUNDS) + 1
+    """
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    buckets: list[int]
+
+    def __init__(self) -> None:
+        """Initialize a new histogram with no measurements."""
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Add the given measurement to this histogram."""
+        if self.count == 0 or seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self.count += 1
+        self.total += seconds
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def percentile(self, p: float) -> float:
+        """Return an upper bound on the p-th percentile of the measurements (the bound of the bucket it falls in,
+        but no more than the largest measurement), or 0.0 if there are none.
+
+        Preconditions:
+            - 0 <= p <= 100
+        """
+        rank = p / 100 * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if bucket and seen >= rank:
+                return min(BUCKET_BOUNDS[i], self.maximum) if i < len(BUCKET_BOUNDS) else self.maximum
+        return 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Return the count, mean, minimum, 50th, 90th and 99th percentiles, and maximum of the measurements."""
+        return {'count': self.count, 'mean': self.total / self.count if self.count else 0.0, 'min': self.minimum,
+                'p50': self.percentile(50), 'p90': self.percentile(90), 'p99': self.percentile(99),
+                'max': self.maximum}
+
+
+class MetricsRegistry:
+    """A registry of named counters and timing histograms.
+
+    Callers check enabled before measuring anything, so metrics cost a single attribute check while they are off.
+
+    >>> registry = MetricsRegistry()
+    >>> registry.count("commands")  # Ignored, since the registry is not enabled
+    >>> registry.enable()
+    >>> registry.count("commands", 2)
+    >>> registry.observe("execute", 0.00001)
+    >>> registry.counters
+    {'commands': 2}
+    >>> registry.histograms["execute"].count
+    1
+
+    Instance Attributes:
+        - enabled: whether metrics are being recorded
+        - counters: a mapping from each counter name to its count
+        - histograms: a mapping from each phase name to the histogram of its timings
+    """
+    enabled: bool
+    counters: dict[str, int]
+    histograms: dict[str, Histogram]
+    # Private Instance Attributes:
+    #   - _started: the time.perf_counter() value when this registry was last enabled
+    _started: float
+
+    def __init__(self) -> None:
+        """Initialize a new, disabled registry with no metrics."""
+        self.enabled = False
+        self.counters = {}
+        self.histograms = {}
+        self._started = time.perf_counter()
+
+    def enable(self, dump_file: Optional[str] = None) -> None:
+        """Start recording metrics. If dump_file is given, the metrics are written to it as JSON when the program
+        exits."""
+        self.enabled = True
+        self._started = time.perf_counter()
+        if dump_file is not None:
+            atexit.register(self.dump, dump_file)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add n to the counter with the given name, if metrics are enabled."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Add a timing of the phase with the given name to its histogram, if metrics are enabled."""
+        if self.enabled:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = Histogram()
+                self.histograms[name] = histogram
+            histogram.observe(seconds)
+
+    def report(self) -> dict[str, Any]:
+        """Return every metric as a JSON-compatible dictionary: the seconds since metrics were enabled, the counters
+        and the rate of each per second, and the summary of each histogram."""
+        elapsed = time.perf_counter() - self._started
+        return {'elapsed': elapsed,
+                'counters': dict(self.counters),
+                'rates': {name: value / elapsed for name, value in self.counters.items()} if elapsed > 0 else {},
+                'timings': {name: histogram.summary() for name, histogram in self.histograms.items()}}
+
+    def report_lines(self) -> list[str]:
+        """Return the lines of a readable summary of every metric, with timings in microseconds."""
+        if not self.enabled:
+            return [f"Metrics are off. Set the {METRICS_ENV} environment variable to turn them on."]
+        report = self.report()
+        lines = [f"=== STATS ({report['elapsed']:.1f}s) ==="]
+        for name, value in sorted(report['counters'].items()):
+            lines.append(f"  {name}: {value} ({report['rates'][name]:.1f}/s)")
+        for name, summary in sorted(report['timings'].items()):
+            lines.append(f"  {name}: n={summary['count']} mean={summary['mean'] * 1e6:.1f}us "
+                         f"p50={summary['p50'] * 1e6:.0f}us p99={summary['p99'] * 1e6:.0f}us "
+                         f"max={summary['max'] * 1e6:.1f}us")
+        return lines
+
+    def dump(self, filename: str) -> None:
+        """Write every metric to the file with the given name, as JSON."""
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+# The registry the game records its metrics in
+METRICS = MetricsRegistry()
+
+
+def enable_from_environment() -> Optional[str]:
+    """Enable METRICS if the ADVENTURE_METRICS environment variable is set, writing them to the file it names when
+    the program exits. Return that file name, or None if metrics stay off."""
+    dump_file = os.environ.get(METRICS_ENV)
+    if dump_file:
+        METRICS.enable(dump_file)
+        return dump_file
+    return None
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    import doctest
+    doctest.testmod()
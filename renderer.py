@@ -0,0 +1,141 @@
+"""CSC111 Project 1: Text Adventure Game - Turn Renderer
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the TurnRenderer class, which draws the screen shown to the player at the start of each
+turn (the status bar, the location, the compass of exits, the items and the options).
+
+The whole screen is put together as one string and written at once, instead of with dozens of separate print calls.
+The parts of the screen that never change, since the map of a world never changes (a location's header, its exits
+and compass, and its travel options), are only put together the first time the location is drawn.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import sys
+from typing import TextIO
+
+from adventure import AdventureGame
+from world_index import DIRECTIONS
+
+WIDTH = 60
+THICK_RULE = "=" * WIDTH
+THIN_RULE = "-" * WIDTH
+
+# The options listed at every location, before and after the options that depend on the location
+SYSTEM_OPTIONS = " OPTIONS:\n  [System]: look, inventory, score, log, map, stats, help, quit\n"
+ALIAS_OPTIONS = "  [Aliases]: n/s/e/w/u/d (move), i (inventory), x (examine), l (look)\n" + THIN_RULE + "\n"
+
+
+class TurnRenderer:
+    """A renderer of the screen shown to the player at the start of each turn.
+
+    A renderer can be used for any number of games in the same world.
+
+    >>> game = AdventureGame('game_data.json', 1)
+    >>> renderer = TurnRenderer()
+    >>> "[Hallway]" in renderer.render(game, True)
+    True
+    >>> _ = game.execute("go north")
+    >>> "[University College]" in renderer.render(game, True)
+    True
+    """
+    # Private Instance Attributes:
+    #   - _static: the parts of the screen that never change (since the map of a world never changes), mapping
+    #              location id to (1) the location's header, (2) its exits and compass, and (3) its travel and action
+    #              options
+    _static: dict[int, tuple[str, str, str]]
+
+    def __init__(self) -> None:
+        """Initialize a new renderer, with nothing drawn yet."""
+        self._static = {}
+
+    def render(self, game: AdventureGame, first_visit: bool) -> str:
+        """Return the screen for the current turn of the given game. The location's long description is shown if
+        first_visit is True, and its brief description otherwise."""
+        location = game.get_location()
+        static = self._static.get(location.id_num)
+        if static is None:
+            static = self._render_static(game)
+            self._static[location.id_num] = static
+        header, compass, options = static
+
+        moves_left = game.max_moves - game.moves
+        status = f" MOVES: {game.moves}/{game.max_moves}  |  ITEMS: {game.count_returned_items()}/{game.goal_count()} "
+        status = status.center(WIDTH)
+        if 0 < moves_left <= 5:
+            status = f" ⚠ WARNING: {moves_left} MOVES LEFT! ⚠ ".center(WIDTH) + "\n" + status
+
+        if location.items:
+            items = f" [!] ITEMS HERE: {', '.join(location.items)}\n"
+        else:
+            items = " [ ] No items visible.\n"
+
+        interact = ""
+        if location.items:
+            interact += "  [Interact]: take <item>, examine <item>\n"
+        if game.inventory:
+            interact += "  [Interact]: drop <item>\n"
+
+        description = location.long_description if first_visit else location.brief_description
+        return (f"\n\n\n{THICK_RULE}\n{status}\n{THICK_RULE}\n{header}{description}\n{THIN_RULE}\n{compass}{items}"
+                f"{THIN_RULE}\n{SYSTEM_OPTIONS}{options}{interact}{ALIAS_OPTIONS}")
+
+    def write(self, game: AdventureGame, first_visit: bool, out: TextIO = sys.stdout) -> None:
+        """Write the screen for the current turn of the given game to out in a single write, and flush it."""
+        out.write(self.render(game, first_visit))
+        out.flush()
+
+    @staticmethod
+    def _render_static(game: AdventureGame) -> tuple[str, str, str]:
+        """Return the header, the exits and compass, and the travel and action options of the current location of
+        the given game."""
+        location = game.get_location()
+        header = f"LOCATION {location.id_num}: {location.name.upper()}\n{THIN_RULE}\n"
+
+        exits = game.exits()
+        brackets = {direction: f"[{exits[direction][1]}]" if direction in exits else "[ ]" for direction in DIRECTIONS}
+        you = "[You]"
+        col_width = max(max(len(bracket) for bracket in brackets.values()), len(you))
+        indent = " " * (col_width + 1)
+
+        compass = f"You can go: {', '.join(exits) if exits else 'nowhere'}\n\n"
+        if "up" in exits:
+            compass += f"{indent}UP: {brackets['up']}\n"
+        compass += f"{indent}{brackets['north']}\n"
+        compass += f"{brackets['west'].ljust(col_width)} {you.ljust(col_width)} {brackets['east'].ljust(col_width)}\n"
+        compass += f"{indent}{brackets['south']}\n"
+        if "down" in exits:
+            compass += f"{indent}DOWN: {brackets['down']}\n"
+        compass += "\n"
+
+        move_cmds = [cmd for cmd in location.available_commands if cmd.startswith("go")]
+        other_cmds = [cmd for cmd in location.available_commands if not cmd.startswith("go")]
+        options = ""
+        if move_cmds:
+            options += f"  [Travel]: {', '.join(move_cmds)}\n"
+        if other_cmds:
+            options += f"  [Action]: {', '.join(other_cmds)}\n"
+        return header, compass, options
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    pass
@@ -22,24 +22,55 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
 from __future__ import annotations
-from event_logger import Event, EventList
-from adventure import AdventureGame
-from game_entities import Location
+from dataclasses import dataclass
+from typing import Optional
+
+from event_logger import EventList
+from adventure import SPEEDRUN_MOVES, AdventureGame
+from solver import solve
+from world_template import load_world
+
+
+@dataclass
+class SimulationOutcome:
+    """The final state of a simulated playthrough.
+
+    Instance Attributes:
+        - id_log: the location IDs of each event in the playthrough, in order
+        - score: the player's final score
+        - moves: the number of moves the player used
+        - ending: "win", "secret", "lose" or "quit" if the game ended, or None if it was still ongoing
+
+    Representation Invariants:
+        - len(self.id_log) > 0
+        - self.score >= 0
+        - self.moves >= 0
+    """
+    id_log: list[int]
+    score: int
+    moves: int
+    ending: Optional[str]
 
 
 class AdventureGameSimulation:
     """A simulation of an adventure game playthrough.
+
+    The simulation applies the same rules as the interactive game (items, locked doors, scoring, the move limit and
+    the endings), so it stops early if the game ends before all commands have been used.
     """
     # Private Instance Attributes:
     #   - _game: The AdventureGame instance that this simulation uses.
     #   - _events: A collection of the events to process during the simulation.
+    #   - _ending: How the game ended, or None if it is still ongoing.
     _game: AdventureGame
     _events: EventList
+    _ending: Optional[str]
 
-    # TODO: Copy/paste your code from A1, and make adjustments as needed
-    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str]) -> None:
+    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str],
+                 max_moves: Optional[int] = None) -> None:
         """
         Initialize a new game simulation based on the given game data, that runs through the given commands.
+        If max_moves is given, it replaces the game's default move limit.
 
         Preconditions:
         - len(commands) > 0
@@ -47,44 +78,30 @@ class AdventureGameSimulation:
         """
         self._events = EventList()
         self._game = AdventureGame(game_data_file, initial_location_id)
+        self._ending = None
+        if max_moves is not None:
+            self._game.max_moves = max_moves
 
-        # Add first event (initial location, no command to reach it)
-        first_location = self._game.get_location()
-        first_event = Event(first_location.id_num, first_location.long_description)
-        self._events.add_event(first_event, None)
+        # Generate the events based on the commands, starting from the initial location
+        self.generate_events(commands)
 
-        # Generate the remaining events based on the commands and initial location
-        self.generate_events(commands, first_location)
-
-    def generate_events(self, commands: list[str], current_location: Location) -> None:
+    def generate_events(self, commands: list[str]) -> None:
         """
-        Generate events in this simulation, based on current_location and commands, a valid list of commands.
+        Generate events in this simulation by playing commands, a valid list of commands, from the game's current
+        location. The first event (for the current location) is added if no events have been generated yet.
 
         Preconditions:
         - len(commands) > 0
-        - all commands in the given list are valid commands when starting from current_location
+        - all commands in the given list are valid commands when starting from the game's current location
         """
-        for command in commands:
-            # Get next location ID from available_commands
-            if command in current_location.available_commands:
-                next_location_id = current_location.available_commands[command]
-            else:
-                next_location_id = current_location.id_num
-
-            # Update game state
-            self._game.current_location_id = next_location_id
-
-            # Get the new location
-            next_location = self._game.get_location()
-
-            # Create event for the new location
-            new_event = Event(next_location.id_num, next_location.long_description)
+        results = self._game.run_batch(commands, self._events)
+        for result in results:
+            if result.ending is not None:
+                self._ending = result.ending
 
-            # Add event with the command that led to it
-            self._events.add_event(new_event, command)
-
-            # Update current_location for next iteration
-            current_location = next_location
+    def get_outcome(self) -> SimulationOutcome:
+        """Return the final score, moves and ending of this simulation, along with its id log."""
+        return SimulationOutcome(self.get_id_log(), self._game.score, self._game.moves, self._ending)
 
     def get_id_log(self) -> list[int]:
         """
@@ -144,12 +161,16 @@ if __name__ == "__main__":
         "drop laptop_charger",
         "drop lucky_mug"
     ]
+    win_outcome = AdventureGameSimulation('game_data.json', 1, win_walkthrough).get_outcome()
+    assert win_outcome.ending == "win" and win_outcome.score == 100 and win_outcome.moves == 19
+
     # Create a list of all the commands needed to walk through your game to reach a 'game over' state
     lose_demo = ["go north", "go south"] * 11  # Exceeds max moves (20)
-    expected_log = [1] + [2, 1] * 11
+    expected_log = [1] + [2, 1] * 10  # The game ends after the 20th move, so the last two commands are never used
     # Uncomment the line below to test your demo
     sim = AdventureGameSimulation('game_data.json', 1, lose_demo)
     assert expected_log == sim.get_id_log()
+    assert sim.get_outcome().ending == "lose"
 
     # TODO: Add code below to provide walkthroughs that show off certain features of the game
     # TODO: Create a list of commands involving visiting locations, picking up items, and then
@@ -169,6 +190,11 @@ if __name__ == "__main__":
     sim = AdventureGameSimulation('game_data.json', 1, scores_demo)
     assert expected_log == sim.get_id_log()
 
+    # The shortest possible win, found by solver.py, earns the SPEEDRUNNER achievement
+    speedrun_demo = solve(load_world('game_data.json'), 1)
+    speedrun_outcome = AdventureGameSimulation('game_data.json', 1, speedrun_demo).get_outcome()
+    assert speedrun_outcome.ending == "win" and speedrun_outcome.moves == len(speedrun_demo) < SPEEDRUN_MOVES
+
     # Add more enhancement_demos if you have more enhancements
     # enhancement1_demo = [...]
     # expected_log = []
@@ -0,0 +1,592 @@
+"""CSC111 Project 1: Text Adventure Game - Walkthrough Solver
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module finds the shortest winning walkthrough of a game world: the list of commands that wins the game
+in the fewest possible moves.
+
+The game is won once every item worth points (target_points > 0) has been dropped at its target position. Locked
+locations can only be entered while carrying their key, after which they stay unlocked.
+
+Most locations only matter as places to walk through, so the search is over the few "points of interest": the
+starting positions of the goal items and keys, the goal items' targets, and the locations locked by goal items that
+are also keys. Walking from one point of interest to another is a single step of the search. Its length is found on
+a much smaller map of "junctions" (the points of interest and the locked locations) and the lock-free walks between
+them, measured once when the search starts.
+
+The search itself is A*, guided by a lower bound on the moves left that ignores locks, so it only looks at the ways
+of winning that could be shortest. Ways of winning that can be no shorter than another are left out: an item is
+always taken as soon as its starting position is reached, and dropped as soon as its target is reached.
+
+Run it from the command line to print the shortest walkthrough of a game data file:
+
+    python solver.py game_data.json 1
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import heapq
+import json
+import math
+import sys
+from collections import deque
+from typing import Iterable, Optional
+
+from adventure import SPEEDRUN_MOVES
+from world_template import WorldTemplate, load_world
+
+# The most places where goal items are picked up or dropped off for which solve bounds the moves left by the
+# shortest walk through all of them (which takes time and memory exponential in their number)
+TOUR_PLACES = 16
+
+# A search state: (point of interest the player is at, bitmask of the keys carried, bitmask of the goal items
+# carried, bitmask of the goal items delivered, bitmask of the locks opened with a goal item that is also a key).
+# Keys that are not goal items are never dropped, so a lock whose key is carried does not need to be remembered as
+# opened; only locks opened by goal items (which are dropped later) do.
+_State = tuple[int, int, int, int, int]
+
+
+class _Map:
+    """The locations reachable from the start (ignoring locks), numbered from 0 in the order they were found, with the
+    goal items, keys and locks that matter for winning.
+
+    Locations that are on no path between two points of interest (dead ends with nothing in them) are cut out of the
+    map: they have no exits, and no exits lead to them. Keys that only open such locations are left out of keys.
+
+    The start, the points of interest and the locations that can be unlocked are the junctions of the map. Every
+    path between junctions is a series of links: walks from one junction to another that pass no other junction,
+    and so no lock. Searches for paths (see walk) are then over the few junctions, rather than every location.
+
+    Instance Attributes:
+        - ids: the location id of each location number
+        - exits: the (location number, command) of each exit of each location
+        - goals: the goal items (worth points)
+        - goal_starts: the location number each goal item starts at, or -1 if it is not at a reachable location
+        - goal_targets: the location number of each goal item's target position, or -1 if it cannot be reached
+        - keys: the keys (takeable items that unlock a location in the map) that are not goal items, and the goal
+          items that are keys, by bit of the key bitmask
+        - key_starts: the location number each key in keys starts at, or -1 if it is not at a reachable location
+        - goal_key_bits: the key bit of each goal item (0 if it is not a key)
+        - lock_key: the key bit needed to enter each location (0 if it is not locked, -1 if it cannot be unlocked)
+        - goal_lock_bits: the opened-lock bit of each location locked by a goal item (0 for every other location)
+        - points: the location numbers of the points of interest
+        - starting_goals, targeted_goals, starting_keys: a mapping from each point of interest to the bitmask of the
+          goal items that start there, the goal items whose target it is, and the keys (that are not goal items)
+          that start there
+        - links: a mapping from each junction to the (junction, length) of each link from it
+        - lock_free: a mapping from the start and each point of interest to the distance (ignoring locks) from it
+          to every junction it can reach
+    """
+    ids: list[int]
+    exits: list[list[tuple[int, str]]]
+    goals: list
+    goal_starts: list[int]
+    goal_targets: list[int]
+    keys: list
+    key_starts: list[int]
+    goal_key_bits: list[int]
+    lock_key: list[int]
+    goal_lock_bits: list[int]
+    points: list[int]
+    starting_goals: dict[int, int]
+    targeted_goals: dict[int, int]
+    starting_keys: dict[int, int]
+    links: dict[int, list[tuple[int, int]]]
+    lock_free: dict[int, dict[int, int]]
+    # Private Instance Attributes:
+    #   - _kinds: whether each location is a junction (1), cannot be entered (2), or neither (0)
+    _kinds: bytearray
+
+    def __init__(self, world: WorldTemplate, start_id: int) -> None:
+        """Initialize the map of the locations reachable from the given start in the given world."""
+        numbers = {start_id: 0}
+        self.ids = [start_id]
+        queue = deque([start_id])
+        while queue:
+            for dest_id in world.locations[queue.popleft()].available_commands.values():
+                if dest_id not in numbers:
+                    numbers[dest_id] = len(self.ids)
+                    self.ids.append(dest_id)
+                    queue.append(dest_id)
+        locations = [world.locations[loc_id] for loc_id in self.ids]
+        self.exits = [[(numbers[dest_id], command) for command, dest_id in location.available_commands.items()]
+                      for location in locations]
+
+        starts = {}
+        for number, location in enumerate(locations):
+            for item_name in location.items:
+                starts[item_name] = number
+        self.goals = [item for item in world.items if item.target_points > 0]
+        self.goal_starts = [starts.get(item.name, -1) for item in self.goals]
+        self.goal_targets = [numbers.get(item.target_position, -1) for item in self.goals]
+
+        # Cutting out dead ends can leave a key with nothing to open, and leaving that key behind can make more
+        # dead ends, so the two are repeated until neither changes
+        self.keys = [item for item in world.items if item.can_take]
+        goal_points = {n for n in self.goal_starts + self.goal_targets if n >= 0} | {0}
+        kept_numbers = goal_points | {starts[item.name] for item in self.keys if item.name in starts}
+        neighbours = [set() for _ in self.ids]
+        for number, exits in enumerate(self.exits):
+            for dest, _ in exits:
+                if dest != number:
+                    neighbours[number].add(dest)
+                    neighbours[dest].add(number)
+        kept = [True] * len(self.ids)
+        candidates = range(len(self.ids))
+        while True:
+            _cut_dead_ends(neighbours, kept, kept_numbers, candidates)
+            key_ids = {location.key_id for n, location in enumerate(locations) if location.locked and kept[n]}
+            keys = [item for item in self.keys if item.id in key_ids]
+            if len(keys) == len(self.keys):
+                break
+            candidates = [starts[item.name] for item in self.keys if item.id not in key_ids and item.name in starts]
+            self.keys = keys
+            kept_numbers = goal_points | {starts[item.name] for item in self.keys if item.name in starts}
+        self.exits = [[(dest, command) for dest, command in exits if kept[dest]] if kept[number] else []
+                      for number, exits in enumerate(self.exits)]
+
+        self.key_starts = [starts.get(item.name, -1) if item.target_points <= 0 else -1 for item in self.keys]
+        key_bits = {item.id: 1 << k for k, item in enumerate(self.keys)}
+        self.goal_key_bits = [key_bits.get(item.id, 0) for item in self.goals]
+
+        goal_key_ids = {item.id for item in self.goals if item.id in key_bits}
+        self.lock_key = []
+        self.goal_lock_bits = []
+        for location in locations:
+            self.lock_key.append(key_bits.get(location.key_id, -1) if location.locked else 0)
+            if location.locked and location.key_id in goal_key_ids:
+                self.goal_lock_bits.append(1 << sum(1 for bit in self.goal_lock_bits if bit))
+            else:
+                self.goal_lock_bits.append(0)
+
+        self.points = sorted({n for n in self.goal_starts + self.goal_targets + self.key_starts if n >= 0}
+                             | {n for n in range(len(self.ids)) if kept[n] and self.goal_lock_bits[n]})
+        self.starting_goals = dict.fromkeys(self.points, 0)
+        self.targeted_goals = dict.fromkeys(self.points, 0)
+        self.starting_keys = dict.fromkeys(self.points, 0)
+        for i in range(len(self.goals)):
+            if self.goal_starts[i] >= 0:
+                self.starting_goals[self.goal_starts[i]] |= 1 << i
+            if self.goal_targets[i] >= 0:
+                self.targeted_goals[self.goal_targets[i]] |= 1 << i
+        for k, number in enumerate(self.key_starts):
+            if number >= 0:
+                self.starting_keys[number] |= 1 << k
+
+        self._kinds = bytearray(len(self.ids))
+        junctions = {0, *self.points}
+        junctions.update(n for n in range(len(self.ids)) if kept[n] and self.lock_key[n] > 0)
+        for number in range(len(self.ids)):
+            if not kept[number] or self.lock_key[number] < 0:
+                self._kinds[number] = 2
+        for number in junctions:
+            self._kinds[number] = 1
+        forward = [[dest for dest, _ in exits] for exits in self.exits]
+        self.links = {number: self._link_ends(forward, number) for number in junctions}
+        self.lock_free = {number: self.walk(number, -1, -1)[0] for number in {0, *self.points}}
+
+    def _link_ends(self, forward: list[list[int]], source: int) -> list[tuple[int, int]]:
+        """Return the (junction, length) of every link from the given junction, where forward[n] is the location
+        number each exit of location n leads to."""
+        kinds = self._kinds
+        seen = bytearray(len(kinds))
+        seen[source] = 1
+        ends = []
+        level = [source]
+        distance = 0
+        while level:
+            distance += 1
+            next_level = []
+            for number in level:
+                for dest in forward[number]:
+                    if seen[dest]:
+                        continue
+                    seen[dest] = 1
+                    if kinds[dest] == 0:
+                        next_level.append(dest)
+                    elif kinds[dest] == 1:
+                        ends.append((dest, distance))
+            level = next_level
+        return ends
+
+    def link_commands(self, source: int, dest: int) -> list[str]:
+        """Return the commands of the link from one junction to the other.
+
+        Preconditions:
+            - dest is a junction in self.links[source]
+        """
+        parents = {source: (-1, '')}
+        queue = deque([source])
+        while dest not in parents:
+            number = queue.popleft()
+            for next_number, command in self.exits[number]:
+                if next_number not in parents and self._kinds[next_number] != 2:
+                    parents[next_number] = (number, command)
+                    if self._kinds[next_number] == 0:
+                        queue.append(next_number)
+        commands = []
+        while dest != source:
+            dest, command = parents[dest]
+            commands.append(command)
+        commands.reverse()
+        return commands
+
+    def walk(self, source: int, keys: int, opened: int) -> tuple[dict[int, int], dict[int, int], int]:
+        """Return (1) the distance from the given junction to every junction it can reach carrying the given keys and
+        passing the given opened locks, (2) the junction each of those was last reached from on its shortest path,
+        and (3) the bitmask of every key whose lock the search came to.
+
+        The search only depends on the keys in (3), so it finds the same for any keys that agree with the given
+        keys on those.
+        """
+        distances = {source: 0}
+        parents = {}
+        seen_locks = 0
+        finished = set()
+        heap = [(0, source)]
+        while heap:
+            distance, number = heapq.heappop(heap)
+            if number in finished:
+                continue
+            finished.add(number)
+            for dest, length in self.links[number]:
+                lock = self.lock_key[dest]
+                if lock > 0:
+                    seen_locks |= lock
+                    if not keys & lock and not opened & self.goal_lock_bits[dest]:
+                        continue
+                if distance + length < distances.get(dest, distance + length + 1):
+                    distances[dest] = distance + length
+                    parents[dest] = number
+                    heapq.heappush(heap, (distance + length, dest))
+        return distances, parents, seen_locks
+
+    def path(self, parents: dict[int, int], source: int, dest: int) -> list[int]:
+        """Return the junctions (after the source) on the path from source to dest found by walk."""
+        numbers = []
+        while dest != source:
+            numbers.append(dest)
+            dest = parents[dest]
+        numbers.reverse()
+        return numbers
+
+
+def _cut_dead_ends(neighbours: list[set[int]], kept: list[bool], kept_numbers: set[int],
+                   candidates: Iterable[int]) -> None:
+    """Cut every location that is on no path between two of the locations in kept_numbers out of the map, starting
+    from the given candidates, where neighbours[n] is the set of locations joined to location n (in either direction)
+    that are still in the map, and kept[n] is whether location n is still in the map.
+
+    Such locations are found by repeatedly cutting out a location (other than those in kept_numbers) that is joined
+    to at most one other location, since a path that goes into it has to come back out the way it went in.
+    """
+    stack = [n for n in candidates if kept[n] and len(neighbours[n]) <= 1 and n not in kept_numbers]
+    while stack:
+        number = stack.pop()
+        if not kept[number]:
+            continue
+        kept[number] = False
+        for other in neighbours[number]:
+            neighbours[other].discard(number)
+            if kept[other] and len(neighbours[other]) <= 1 and other not in kept_numbers:
+                stack.append(other)
+        neighbours[number].clear()
+
+
+def solve(world: WorldTemplate, start_id: int) -> Optional[list[str]]:
+    """Return a shortest list of commands that wins the game in the given world, starting at the location with the
+    given id, or None if the game cannot be won.
+
+    This is an A* search over the points of interest of the world (see the top of this module). Items are only
+    picked up from where they start and only dropped at their target, since moving them anywhere else never
+    shortens a win, and an item that cannot be taken is never picked up.
+
+    >>> world = load_world('game_data.json')
+    >>> len(solve(world, 1))
+    17
+    """
+    world_map = _Map(world, start_id)
+    goals = world_map.goals
+    done = 0
+    for i, item in enumerate(goals):
+        if world_map.goal_targets[i] >= 0 and world_map.goal_starts[i] == world_map.goal_targets[i]:
+            done |= 1 << i
+        elif world_map.goal_starts[i] < 0 or world_map.goal_targets[i] < 0 or not item.can_take:
+            return None
+    all_done = (1 << len(goals)) - 1
+    plain_goals = sum(1 << i for i in range(len(goals)) if not world_map.goal_key_bits[i])
+    if done == all_done:
+        return []
+
+    # The places where goal items are still to be picked up or dropped off, by bit, for the bounds in estimate
+    places = sorted({world_map.goal_starts[i] for i in range(len(goals)) if not done & (1 << i)}
+                    | {world_map.goal_targets[i] for i in range(len(goals)) if not done & (1 << i)})
+    place_bits = {p: 1 << k for k, p in enumerate(places)}
+    target_bits = 0
+    for i in range(len(goals)):
+        if not done & (1 << i):
+            target_bits |= place_bits[world_map.goal_targets[i]]
+    tours: dict[tuple[int, int], float] = {}
+
+    def tour(to_visit: int, first: int) -> float:
+        """Return the length (ignoring locks) of the shortest walk that starts at places[first], goes to every place
+        in the bitmask to_visit (which includes it), and ends at a goal item's target."""
+        rest = to_visit & ~(1 << first)
+        if rest == 0:
+            return 0 if target_bits & (1 << first) else math.inf
+        if (to_visit, first) not in tours:
+            lock_free = world_map.lock_free[places[first]]
+            shortest = math.inf
+            for k in range(len(places)):
+                if rest & (1 << k) and places[k] in lock_free:
+                    shortest = min(shortest, lock_free[places[k]] + tour(rest, k))
+            tours[to_visit, first] = shortest
+        return tours[to_visit, first]
+
+    def spanning_tree(number: int, to_visit: list[int]) -> int:
+        """Return the weight of the lightest tree joining the given location and places, where two places are
+        joined by the distance between them (ignoring locks) in whichever direction is shorter."""
+        def gap(p: int, q: int) -> int:
+            """Return the distance between the given places, or 0 if neither can be reached from the other."""
+            there, back = world_map.lock_free[p].get(q, -1), world_map.lock_free[q].get(p, -1)
+            return min(there, back) if there >= 0 and back >= 0 else max(there, back, 0)
+
+        closest = {p: gap(number, p) for p in to_visit if p != number}
+        weight = 0
+        while closest:
+            p = min(closest, key=closest.get)
+            weight += closest.pop(p)
+            for q in closest:
+                closest[q] = min(closest[q], gap(p, q))
+        return weight
+
+    estimates: dict[tuple[int, int, int], int] = {}
+
+    def estimate(state: _State) -> int:
+        """Return a lower bound on the moves needed to win from the given state (ignoring locks), or -1 if it
+        cannot be won.
+
+        Every goal item left needs a take and a drop or just a drop. The walk left is at least as long as the
+        longest trip to deliver a single goal item. It is also at least as long as the shortest walk that goes to
+        every place where a goal item is still to be picked up or dropped off, in any order, and ends at a target;
+        if there are more than TOUR_PLACES such places, the lightest tree joining them is used instead.
+        """
+        number, _, carried, delivered, _ = state
+        memo_key = (number, carried, delivered)
+        if memo_key in estimates:
+            return estimates[memo_key]
+        lock_free = world_map.lock_free[number]
+        actions = 0
+        walk = 0
+        to_visit = 0
+        for i in range(len(goals)):
+            bit = 1 << i
+            if delivered & bit:
+                continue
+            target = world_map.goal_targets[i]
+            to_visit |= place_bits[target]
+            if carried & bit:
+                actions += 1
+                distance = lock_free.get(target, -1)
+            else:
+                actions += 2
+                goal_start = world_map.goal_starts[i]
+                to_visit |= place_bits[goal_start]
+                distance = lock_free.get(goal_start, -1)
+                if distance >= 0:
+                    distance += world_map.lock_free[goal_start].get(target, -1)
+            if distance < 0:
+                estimates[memo_key] = -1
+                return -1
+            walk = max(walk, distance)
+
+        if to_visit and len(places) <= TOUR_PLACES:
+            shortest = min((lock_free[p] + tour(to_visit, k) for k, p in enumerate(places)
+                            if to_visit & (1 << k) and p in lock_free), default=math.inf)
+            if shortest == math.inf:
+                estimates[memo_key] = -1
+                return -1
+            walk = max(walk, int(shortest))
+        elif to_visit:
+            walk = max(walk, spanning_tree(number, [p for k, p in enumerate(places) if to_visit & (1 << k)]))
+        estimates[memo_key] = actions + walk
+        return estimates[memo_key]
+
+    # The walks from each (location, opened locks), with the keys they came to and the keys carried among those
+    walks: dict[tuple[int, int], list[tuple[int, int, dict[int, tuple[int, int]]]]] = {}
+
+    def reachable(number: int, keys: int, opened: int) -> dict[int, tuple[int, int]]:
+        """Return the distance to each point of interest reachable from the given location, and the locks opened by
+        goal items on the way there, carrying the given keys."""
+        earlier = walks.setdefault((number, opened), [])
+        for seen_locks, seen_keys, result in earlier:
+            if keys & seen_locks == seen_keys:
+                return result
+        distances, parents, seen_locks = world_map.walk(number, keys, opened)
+        result = {}
+        for point in world_map.points:
+            if point in distances and point != number:
+                passed = opened
+                for n in world_map.path(parents, number, point):
+                    passed |= world_map.goal_lock_bits[n]
+                result[point] = (distances[point], passed)
+        earlier.append((seen_locks, keys & seen_locks, result))
+        return result
+
+    # A state is no better than another at the same place, with the same goal items taken and locks opened, that
+    # was reached in as few moves, carrying at least the same keys, with at least the same goal items delivered
+    # (and carrying the same goal items that are keys). For each (place, goal items taken, locks opened), these are
+    # the (keys, goal items delivered, moves) of the states reached that no other state is better than.
+    frontier: dict[tuple[int, int, int], list[tuple[int, int, int]]] = {}
+
+    def dominated(state: _State, cost: int) -> bool:
+        """Return whether another state reached so far is at least as good as the given state reached in cost moves,
+        and record the given state as reached otherwise."""
+        number, keys, carried, delivered, opened = state
+        reached = frontier.setdefault((number, carried | delivered, opened), [])
+        for other_keys, other_delivered, other_cost in reached:
+            if other_cost <= cost and other_keys & keys == keys and other_delivered & delivered == delivered \
+                    and (other_delivered ^ delivered) & plain_goals == other_delivered ^ delivered:
+                return True
+        reached[:] = [(other_keys, other_delivered, other_cost) for other_keys, other_delivered, other_cost in reached
+                      if not (cost <= other_cost and keys & other_keys == other_keys
+                              and delivered & other_delivered == other_delivered
+                              and (other_delivered ^ delivered) & plain_goals == other_delivered ^ delivered)]
+        reached.append((keys, delivered, cost))
+        return False
+
+    start: _State = (0, 0, 0, done, 0)
+    dominated(start, 0)
+    best = {start: 0}
+    parents: dict[_State, tuple[Optional[_State], object]] = {start: (None, None)}
+    heap = [(estimate(start), 0, 0, start)]
+    counter = 1
+    while heap:
+        _, cost, _, state = heapq.heappop(heap)
+        if cost > best[state] or (state[1], state[3], cost) not in frontier[state[0], state[2] | state[3], state[4]]:
+            continue
+        number, keys, carried, delivered, opened = state
+        if delivered == all_done:
+            return _walkthrough(world_map, parents, state)
+
+        # Taking a goal item where it starts, or dropping a goal item (that is not a key) at its target, is never
+        # worse done now than later, so it is the only thing tried
+        untaken = ~(carried | delivered)
+        acts_at = world_map.starting_goals.get(number, 0) & untaken
+        acts_at |= world_map.targeted_goals.get(number, 0) & carried & plain_goals
+        if acts_at:
+            i = (acts_at & -acts_at).bit_length() - 1
+            bit = 1 << i
+            if carried & bit:
+                successors = [((number, keys, carried & ~bit, delivered | bit, opened), 1, f"drop {goals[i].name}")]
+            else:
+                successors = [((number, keys, carried | bit, delivered, opened), 1, f"take {goals[i].name}")]
+        else:
+            successors = []
+            for i, item in enumerate(goals):
+                if carried & (1 << i) and world_map.goal_targets[i] == number:
+                    successors.append(((number, keys, carried & ~(1 << i), delivered | (1 << i), opened), 1,
+                                       f"drop {item.name}"))
+            for k, item in enumerate(world_map.keys):
+                if world_map.key_starts[k] == number and not keys & (1 << k):
+                    successors.append(((number, keys | (1 << k), carried, delivered, opened), 1,
+                                       f"take {item.name}"))
+
+            # Only walk to a point of interest where something is left to do, and not by way of a point where a goal
+            # item is to be taken or dropped (stopping there first would be no longer, and get more done)
+            carried_keys = keys
+            for i in range(len(goals)):
+                if carried & (1 << i):
+                    carried_keys |= world_map.goal_key_bits[i]
+            nearby = reachable(number, carried_keys, opened)
+            stops = [(point, distance, passed) for point, (distance, passed) in nearby.items()
+                     if world_map.starting_goals[point] & untaken
+                     or world_map.targeted_goals[point] & carried & plain_goals]
+            for point, (distance, passed) in nearby.items():
+                if not (world_map.starting_keys[point] & ~keys or world_map.targeted_goals[point] & carried
+                        or world_map.starting_goals[point] & untaken or world_map.goal_lock_bits[point] & ~opened):
+                    continue
+                for stop, stop_distance, stop_passed in stops:
+                    via_stop = reachable(stop, carried_keys, stop_passed).get(point)
+                    if stop != point and via_stop is not None and stop_distance + via_stop[0] == distance \
+                            and via_stop[1] & passed == passed:
+                        break
+                else:
+                    successors.append(((point, keys, carried, delivered, passed), distance,
+                                       (number, point, carried_keys, opened)))
+
+        for next_state, step, action in successors:
+            next_cost = cost + step
+            if next_cost < best.get(next_state, next_cost + 1):
+                remaining = estimate(next_state)
+                if remaining < 0 or dominated(next_state, next_cost):
+                    continue
+                best[next_state] = next_cost
+                parents[next_state] = (state, action)
+                heapq.heappush(heap, (next_cost + remaining, next_cost, counter, next_state))
+                counter += 1
+    return None
+
+
+def _walkthrough(world_map: _Map, parents: dict[_State, tuple[Optional[_State], object]], state: _State) -> list[str]:
+    """Return the commands leading from the start of the search to the given state. Walks between points of
+    interest are searched for again, the same way, to find their commands."""
+    steps = []
+    parent, action = parents[state]
+    while parent is not None:
+        steps.append(action)
+        parent, action = parents[parent]
+    steps.reverse()
+
+    commands = []
+    for action in steps:
+        if isinstance(action, str):
+            commands.append(action)
+        else:
+            source, dest, keys, opened = action
+            walk_parents = world_map.walk(source, keys, opened)[1]
+            for junction in world_map.path(walk_parents, source, dest):
+                commands.extend(world_map.link_commands(source, junction))
+                source = junction
+    return commands
+
+
+def can_speedrun(world: WorldTemplate, start_id: int, threshold: int = SPEEDRUN_MOVES) -> bool:
+    """Return whether the game in the given world can be won in fewer than threshold moves from the given start.
+
+    >>> can_speedrun(load_world('game_data.json'), 1)
+    True
+    """
+    walkthrough = solve(world, start_id)
+    return walkthrough is not None and len(walkthrough) < threshold
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    if len(sys.argv) != 3:
+        print("Usage: python solver.py <game data file> <initial location id>")
+    else:
+        solution = solve(load_world(sys.argv[1]), int(sys.argv[2]))
+        if solution is None:
+            print("This game cannot be won.")
+        else:
+            # Printed as a walkthrough line for walkthrough_runner.py
+            print(json.dumps({'id': 'shortest', 'start': int(sys.argv[2]), 'commands': solution}))
@@ -0,0 +1,275 @@
+"""CSC111 Project 1: Text Adventure Game - Parallel Walkthrough Runner
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module replays large files of walkthroughs (lists of commands, like the demos in simulation.py)
+across a pool of worker processes, and reports the outcome of every run along with the overall throughput.
+
+A walkthrough file has one JSON object per line, for example:
+
+    {"id": "win", "commands": ["take t_card", "go north"], "start": 1, "max_moves": 30}
+
+where "start" (default 1) and "max_moves" (default: the game's own limit) are optional. A walkthrough that cannot
+be replayed (for example, a line that is not a JSON object, one without a list of commands, or one starting at a
+location that does not exist) does not stop the others: its result records what is wrong with it instead of an
+outcome.
+
+Run it from the command line with:
+
+    python walkthrough_runner.py walkthroughs.jsonl --data game_data.json --workers 4 --out results.jsonl
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from simulation import AdventureGameSimulation, SimulationOutcome
+from world_template import WorldTemplate, load_world
+
+
+@dataclass
+class WalkthroughResult:
+    """The outcome of replaying one walkthrough.
+
+    Instance Attributes:
+        - walkthrough_id: the id of the walkthrough in its file
+        - outcome: the id log, score, moves and ending of the run, or None if the walkthrough could not be replayed
+        - error: what is wrong with the walkthrough, if it could not be replayed
+
+    Representation Invariants:
+        - (self.outcome is None) == (self.error is not None)
+    """
+    walkthrough_id: str
+    outcome: Optional[SimulationOutcome]
+    error: Optional[str] = None
+
+
+@dataclass
+class RunSummary:
+    """Aggregated results of replaying a file of walkthroughs.
+
+    Instance Attributes:
+        - runs: the number of walkthroughs replayed
+        - elapsed: the wall-clock time the replay took, in seconds
+        - endings: the number of runs that finished with each ending ("none" for runs still ongoing, and "error"
+          for walkthroughs that could not be replayed)
+        - total_score: the sum of the final scores of all runs
+
+    Representation Invariants:
+        - self.runs >= 0
+        - self.elapsed >= 0
+        - sum(self.endings.values()) == self.runs
+    """
+    runs: int = 0
+    elapsed: float = 0.0
+    endings: dict[str, int] = field(default_factory=dict)
+    total_score: int = 0
+
+    def record(self, result: WalkthroughResult) -> None:
+        """Add the given result to this summary.
+
+        >>> summary = RunSummary()
+        >>> summary.record(WalkthroughResult('a', SimulationOutcome([1, 2], 10, 1, None)))
+        >>> summary.record(WalkthroughResult('b', None, "missing or invalid commands"))
+        >>> summary.runs, summary.endings, summary.total_score
+        (2, {'none': 1, 'error': 1}, 10)
+        """
+        if result.outcome is None:
+            ending = "error"
+        else:
+            ending = result.outcome.ending or "none"
+            self.total_score += result.outcome.score
+        self.runs += 1
+        self.endings[ending] = self.endings.get(ending, 0) + 1
+
+    def runs_per_second(self) -> float:
+        """Return the throughput of the replay, in walkthroughs per second."""
+        return self.runs / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def read_walkthroughs(filename: str) -> Iterator[dict[str, Any]]:
+    """Yield the walkthroughs in the given file one at a time, without reading the whole file into memory.
+    Walkthroughs without an "id" are numbered by their line in the file.
+
+    A line that is not a JSON object is yielded as a walkthrough numbered by its line, with an "invalid" field
+    saying what is wrong with it, so that it is reported like any other walkthrough that cannot be replayed.
+
+    >>> import os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'walkthroughs.jsonl')
+    >>> with open(filename, 'w') as f:
+    ...     _ = f.write('{"commands": ["look"]}\\n[1]\\n{"commands": \\n')
+    >>> for walkthrough in read_walkthroughs(filename):
+    ...     print(walkthrough)
+    {'commands': ['look'], 'id': '1'}
+    {'id': '2', 'invalid': 'not a JSON object'}
+    {'id': '3', 'invalid': 'not valid JSON'}
+    """
+    with open(filename, 'r') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                walkthrough = json.loads(line)
+            except ValueError:
+                yield {'id': str(line_number), 'invalid': "not valid JSON"}
+                continue
+            if isinstance(walkthrough, dict):
+                walkthrough.setdefault('id', str(line_number))
+                yield walkthrough
+            else:
+                yield {'id': str(line_number), 'invalid': "not a JSON object"}
+
+
+def _walkthrough_problem(walkthrough: dict[str, Any], world: WorldTemplate) -> Optional[str]:
+    """Return what is wrong with the given walkthrough that stops it from being replayed in the given world, or None
+    if it can be replayed."""
+    if 'invalid' in walkthrough:
+        return walkthrough['invalid']
+    commands = walkthrough.get('commands')
+    if not isinstance(commands, list) or not commands or not all(isinstance(command, str) for command in commands):
+        return "missing or invalid commands"
+    start = walkthrough.get('start', 1)
+    if not isinstance(start, int) or isinstance(start, bool) or start not in world.locations:
+        return f"start location {start!r} does not exist"
+    max_moves = walkthrough.get('max_moves')
+    if max_moves is not None and (not isinstance(max_moves, int) or isinstance(max_moves, bool) or max_moves <= 0):
+        return f"invalid max_moves {max_moves!r}"
+    return None
+
+
+def _run_chunk(game_data_file: str, chunk: list[dict[str, Any]]) -> list[WalkthroughResult]:
+    """Replay the given walkthroughs in this worker process and return their results. Walkthroughs that cannot be
+    replayed get a result with the reason instead of an outcome.
+
+    >>> results = _run_chunk('game_data.json', [{'id': 'a', 'commands': ['go north']},
+    ...                                         {'id': 'b', 'commands': ['look'], 'start': 99}, {'id': 'c'},
+    ...                                         {'id': 'd', 'commands': ['look'], 'max_moves': 0}])
+    >>> [(result.walkthrough_id, result.error) for result in results]  # doctest: +NORMALIZE_WHITESPACE
+    [('a', None), ('b', 'start location 99 does not exist'), ('c', 'missing or invalid commands'),
+     ('d', 'invalid max_moves 0')]
+    >>> results[0].outcome.id_log
+    [1, 2]
+    """
+    world = load_world(game_data_file)
+    results = []
+    for walkthrough in chunk:
+        problem = _walkthrough_problem(walkthrough, world)
+        if problem is not None:
+            results.append(WalkthroughResult(str(walkthrough['id']), None, problem))
+            continue
+        sim = AdventureGameSimulation(game_data_file, walkthrough.get('start', 1), walkthrough['commands'],
+                                      walkthrough.get('max_moves'))
+        results.append(WalkthroughResult(str(walkthrough['id']), sim.get_outcome()))
+    return results
+
+
+def _chunks(walkthroughs: Iterator[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield the given walkthroughs in lists of (at most) chunk_size."""
+    chunk = []
+    for walkthrough in walkthroughs:
+        chunk.append(walkthrough)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_walkthroughs(filename: str, game_data_file: str, workers: Optional[int] = None,
+                     chunk_size: int = 256) -> Iterator[WalkthroughResult]:
+    """Replay every walkthrough in the given file across a pool of worker processes, yielding each result as
+    soon as its chunk finishes. Results are therefore not necessarily in file order.
+
+    Only a few chunks per worker are in flight at a time, so memory use does not grow with the size of the file.
+
+    Preconditions:
+        - workers is None or workers > 0
+        - chunk_size > 0
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    chunks = _chunks(read_walkthroughs(filename), chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: set[Future] = set()
+        exhausted = False
+        while in_flight or not exhausted:
+            while not exhausted and len(in_flight) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    in_flight.add(executor.submit(_run_chunk, game_data_file, chunk))
+            if in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def main(argv: Optional[list[str]] = None) -> RunSummary:
+    """Replay a walkthrough file from the command line, optionally writing each result as a JSON line, and
+    print a summary with the throughput."""
+    parser = argparse.ArgumentParser(description="Replay a file of walkthroughs in parallel.")
+    parser.add_argument('walkthroughs', help="walkthrough file, one JSON object per line")
+    parser.add_argument('--data', default='game_data.json', help="game data file")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--chunk-size', type=int, default=256, help="walkthroughs per task")
+    parser.add_argument('--out', default=None, help="file to write each result to, as JSON lines")
+    args = parser.parse_args(argv)
+
+    summary = RunSummary()
+    out = open(args.out, 'w') if args.out else None
+    start = time.perf_counter()
+    try:
+        for result in run_walkthroughs(args.walkthroughs, args.data, args.workers, args.chunk_size):
+            summary.record(result)
+            if out and result.outcome is None:
+                out.write(json.dumps({'id': result.walkthrough_id, 'error': result.error}) + '\n')
+            elif out:
+                outcome = result.outcome
+                out.write(json.dumps({'id': result.walkthrough_id, 'id_log': outcome.id_log,
+                                      'score': outcome.score, 'moves': outcome.moves,
+                                      'ending': outcome.ending}) + '\n')
+    finally:
+        if out:
+            out.close()
+    summary.elapsed = time.perf_counter() - start
+
+    print(f"Replayed {summary.runs} walkthroughs in {summary.elapsed:.2f}s "
+          f"({summary.runs_per_second():.0f} per second)")
+    for ending, count in sorted(summary.endings.items()):
+        print(f"  {ending}: {count}")
+    if summary.runs:
+        print(f"  average score: {summary.total_score / summary.runs:.1f}")
+    return summary
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    main(sys.argv[1:])
@@ -0,0 +1,294 @@
+"""CSC111 Project 1: Text Adventure Game - Compiled World Format
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module compiles a game data JSON file into a compact binary file, and loads compiled files by
+memory-mapping them, so that starting a game does not need to parse any JSON.
+
+Compile a game data file from the command line with:
+
+    python world_compiler.py game_data.json game_data.world
+
+A compiled file can be used anywhere a game data file can, e.g. AdventureGame('game_data.world', 1).
+
+File layout (all numbers little-endian):
+    - a header (HEADER) with the number of locations and items and the offset of each section below
+    - the ids of all locations in increasing order, as 32-bit integers
+    - one fixed-width LOCATION record per location, in the same order as the ids
+    - the EXIT records (command and destination id) of every location, grouped by location
+    - the NAME records of the items initially at every location, grouped by location
+    - one fixed-width ITEM record per item, in game data order
+    - the NAME records of the aliases of every item, grouped by item
+    - a table of all strings, UTF-8 encoded, each string stored once
+
+Every string in a record is stored as its (offset, length) in the string table.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import mmap
+import struct
+import sys
+from bisect import bisect_left
+from typing import Any, Iterator
+
+from game_entities import Location, Item
+from world_template import CachedLocations, WorldTemplate
+
+MAGIC = b'ADVW'
+FORMAT_VERSION = 2
+
+# magic, format version, location count, item count, then the offsets of the ids, locations, exits,
+# location items, items, aliases and strings sections
+HEADER = struct.Struct('<4sIIIIIIIIII')
+# id, name, brief description, long description, locked, key id, first exit, exit count, first item, item count
+LOCATION = struct.Struct('<iIIIIIIBxxxiIIII')
+# command, destination location id
+EXIT = struct.Struct('<IIi')
+# a single string (an item name or an alias)
+NAME = struct.Struct('<II')
+# id, name, description, flags (ITEM_CAN_TAKE, ITEM_SECRET_ENDING), target position, target points, first alias,
+# alias count
+ITEM = struct.Struct('<iIIIIBxxxiiII')
+ITEM_CAN_TAKE = 1
+ITEM_SECRET_ENDING = 2
+
+
+class _StringTable:
+    """The string table of a file being compiled, which stores each distinct string once.
+
+    Instance Attributes:
+        - data: the encoded strings so far
+        - refs: a mapping from each string added so far to its (offset, length) in data
+    """
+    data: bytearray
+    refs: dict[str, tuple[int, int]]
+
+    def __init__(self) -> None:
+        """Initialize a new, empty string table."""
+        self.data = bytearray()
+        self.refs = {}
+
+    def add(self, text: str) -> tuple[int, int]:
+        """Add the given string to the table if it is not already there, and return its (offset, length)."""
+        ref = self.refs.get(text)
+        if ref is None:
+            encoded = text.encode('utf-8')
+            ref = (len(self.data), len(encoded))
+            self.data.extend(encoded)
+            self.refs[text] = ref
+        return ref
+
+
+def compile_world(data: dict[str, Any]) -> bytes:
+    """Return the compiled binary form of the given game data, in the format of game_data.json.
+
+    Preconditions:
+        - location ids are unique
+    """
+    strings = _StringTable()
+    locations = sorted(data['locations'], key=lambda loc_data: loc_data['id'])
+
+    ids = struct.pack(f'<{len(locations)}i', *(loc_data['id'] for loc_data in locations))
+    location_records = bytearray()
+    exit_records = bytearray()
+    item_name_records = bytearray()
+    exit_count = 0
+    item_name_count = 0
+    for loc_data in locations:
+        commands = loc_data['available_commands']
+        location_records.extend(LOCATION.pack(
+            loc_data['id'], *strings.add(loc_data['name']), *strings.add(loc_data['brief_description']),
+            *strings.add(loc_data['long_description']), loc_data.get('locked', False), loc_data.get('key_id', -1),
+            exit_count, len(commands), item_name_count, len(loc_data['items'])))
+        for command, dest_id in commands.items():
+            exit_records.extend(EXIT.pack(*strings.add(command), dest_id))
+        for item_name in loc_data['items']:
+            item_name_records.extend(NAME.pack(*strings.add(item_name)))
+        exit_count += len(commands)
+        item_name_count += len(loc_data['items'])
+
+    item_records = bytearray()
+    alias_records = bytearray()
+    alias_count = 0
+    for item_data in data['items']:
+        aliases = item_data.get('aliases', [])
+        item_records.extend(ITEM.pack(
+            item_data['id'], *strings.add(item_data['name']), *strings.add(item_data['description']),
+            item_data['can_take'] * ITEM_CAN_TAKE | item_data.get('secret_ending', False) * ITEM_SECRET_ENDING,
+            item_data['target_position'], item_data['target_points'],
+            alias_count, len(aliases)))
+        for alias in aliases:
+            alias_records.extend(NAME.pack(*strings.add(alias)))
+        alias_count += len(aliases)
+
+    sections = [ids, location_records, exit_records, item_name_records, item_records, alias_records, strings.data]
+    offsets = []
+    offset = HEADER.size
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(locations), len(data['items']), *offsets)
+    return header + b''.join(sections)
+
+
+def compile_world_file(json_file: str, compiled_file: str) -> None:
+    """Compile the game data JSON file with the given name, and save it to compiled_file.
+
+    Preconditions:
+        - json_file is the filename of a valid game data JSON file
+    """
+    with open(json_file, 'r') as f:
+        compiled = compile_world(json.load(f))
+    with open(compiled_file, 'wb') as f:
+        f.write(compiled)
+
+
+def _decode(data: mmap.mmap, strings_offset: int, offset: int, length: int) -> str:
+    """Return the string at the given (offset, length) of the string table, which starts at strings_offset of data."""
+    start = strings_offset + offset
+    return data[start:start + length].decode('utf-8')
+
+
+def is_compiled_world(filename: str) -> bool:
+    """Return whether the file with the given name is a compiled world file."""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CompiledLocations(CachedLocations):
+    """A read-only mapping from location id to Location, which decodes each location from a memory-mapped compiled
+    world file when it is looked up, keeping the most recently used ones in memory.
+
+    Since the file is memory-mapped read-only, every process using the same compiled file shares one copy of it.
+    """
+    # Private Instance Attributes:
+    #   - _data: the contents of the compiled world file, memory-mapped
+    #   - _ids: the ids of all locations, in increasing order (the ids section of the file)
+    #   - _sections: the offsets of the locations, exits, location items and strings sections of the file
+    _data: mmap.mmap
+    _ids: memoryview
+    _sections: tuple[int, int, int, int]
+
+    def __init__(self, data: mmap.mmap, ids: memoryview, sections: tuple[int, int, int, int],
+                 capacity: int) -> None:
+        """Initialize a new mapping over the given compiled world file.
+
+        Preconditions:
+            - capacity > 0
+        """
+        super().__init__(capacity)
+        self._data = data
+        self._ids = ids
+        self._sections = sections
+
+    def _position(self, loc_id: object) -> int:
+        """Return the position of the location with the given id in the file, or -1 if there is none."""
+        if not isinstance(loc_id, int):
+            return -1
+        position = bisect_left(self._ids, loc_id)
+        if position < len(self._ids) and self._ids[position] == loc_id:
+            return position
+        return -1
+
+    def _text(self, offset: int, length: int) -> str:
+        """Return the string at the given offset of the string table, with the given encoded length."""
+        return _decode(self._data, self._sections[3], offset, length)
+
+    def _load(self, loc_id: int) -> Location:
+        """Decode and return the location with the given id from the file.
+
+        Raise KeyError if there is no location with the given id.
+        """
+        position = self._position(loc_id)
+        if position == -1:
+            raise KeyError(loc_id)
+        locations_offset, exits_offset, items_offset, _ = self._sections
+        (_, name_offset, name_length, brief_offset, brief_length, long_offset, long_length, locked, key_id,
+         first_exit, exit_count, first_item, item_count) = LOCATION.unpack_from(
+            self._data, locations_offset + position * LOCATION.size)
+
+        commands = {}
+        for i in range(first_exit, first_exit + exit_count):
+            offset, length, dest_id = EXIT.unpack_from(self._data, exits_offset + i * EXIT.size)
+            commands[sys.intern(self._text(offset, length))] = dest_id
+        items = tuple(sys.intern(self._text(*NAME.unpack_from(self._data, items_offset + i * NAME.size)))
+                      for i in range(first_item, first_item + item_count))
+
+        return Location(loc_id, self._text(name_offset, name_length), self._text(brief_offset, brief_length),
+                        self._text(long_offset, long_length), commands, items, False, bool(locked), key_id)
+
+    def __contains__(self, loc_id: object) -> bool:
+        """Return whether there is a location with the given id, without decoding it."""
+        return self._position(loc_id) != -1
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the ids of all locations, in increasing order."""
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        """Return the number of locations in the file."""
+        return len(self._ids)
+
+
+def load_compiled_world(filename: str, capacity: int = 4096) -> WorldTemplate:
+    """Return a world template for the given compiled world file, whose locations are decoded on first access.
+    Only the header and the items are read up front.
+
+    Preconditions:
+        - filename is the filename of a file produced by compile_world_file
+        - capacity > 0
+    """
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    (magic, version, location_count, item_count, ids_offset, locations_offset, exits_offset, location_items_offset,
+     items_offset, aliases_offset, strings_offset) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{filename} is not a compiled world file (version {FORMAT_VERSION})")
+
+    ids = memoryview(data)[ids_offset:ids_offset + 4 * location_count].cast('i')
+    locations = CompiledLocations(data, ids, (locations_offset, exits_offset, location_items_offset, strings_offset),
+                                  capacity)
+
+    items = []
+    for i in range(item_count):
+        (item_id, name_offset, name_length, description_offset, description_length, flags, target_position,
+         target_points, first_alias, alias_count) = ITEM.unpack_from(data, items_offset + i * ITEM.size)
+        alias_refs = (NAME.unpack_from(data, aliases_offset + j * NAME.size)
+                      for j in range(first_alias, first_alias + alias_count))
+        aliases = tuple(sys.intern(_decode(data, strings_offset, *ref)) for ref in alias_refs)
+        items.append(Item(item_id, sys.intern(_decode(data, strings_offset, name_offset, name_length)),
+                          _decode(data, strings_offset, description_offset, description_length),
+                          bool(flags & ITEM_CAN_TAKE), target_position, target_points, aliases,
+                          bool(flags & ITEM_SECRET_ENDING)))
+
+    return WorldTemplate(locations, items)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    if len(sys.argv) != 3:
+        print("Usage: python world_compiler.py <game data JSON file> <compiled world file>")
+    else:
+        compile_world_file(sys.argv[1], sys.argv[2])
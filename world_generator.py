@@ -0,0 +1,273 @@
+"""CSC111 Project 1: Text Adventure Game - World Generator
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module generates large random game worlds in the format of game_data.json, to measure how the game
+behaves with far more locations and items than game_data.json has (how long worlds take to load, how fast commands
+and lookups are, how fast walkthroughs can be simulated).
+
+A world is generated from a seed, so the same seed and sizes always give the same world. Every generated world can
+be won (ignoring the move limit):
+    - Location 1 is the start, and the target position of every item.
+    - The locations are joined into a tree by exits in opposite directions ("go north" one way, "go south" back),
+      where every location other than the start is joined to a location with a smaller id. Some more exits are then
+      added between random locations, which only ever add ways around the tree.
+    - The key of a locked location is always in a location with a smaller id. Every location can therefore be
+      reached in order of id: the locks on the way to it have smaller ids, and so have keys that can be reached
+      before them.
+
+Run it from the command line with:
+
+    python world_generator.py big_world.json --locations 100000 --goals 10 --locks 50 --seed 1
+
+Worlds are written one location at a time, so even worlds with millions of locations can be generated.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import sys
+from array import array
+from typing import Any, Optional, TextIO
+
+from world_index import DIRECTIONS
+
+# The direction of the exit back, for each direction
+OPPOSITES = {"north": "south", "south": "north", "east": "west", "west": "east", "up": "down", "down": "up"}
+
+# The directions by number, and the number of the direction back for each
+_NAMES = list(DIRECTIONS)
+_BACK = [_NAMES.index(OPPOSITES[name]) for name in _NAMES]
+
+# The words location names are made from
+ADJECTIVES = ["Old", "Quiet", "Crowded", "Dusty", "Sunny", "Narrow", "Grand", "Hidden", "Cold", "Bright"]
+PLACES = ["Hallway", "Library", "Lecture Hall", "Courtyard", "Lab", "Stairwell", "Cafe", "Office", "Atrium",
+          "Study Room"]
+
+# The chance that a new location is joined to the previous one rather than to a random earlier one. Higher values
+# give longer corridors, and so longer walks between places.
+CORRIDOR_CHANCE = 0.5
+
+# The number of extra exits (beyond those of the tree) for every location
+EXTRA_EXITS = 0.1
+
+
+class _Layout:
+    """The exits, locks and item positions of a generated world, before it is written out.
+
+    Location ids are 1 to num_locations, and directions are numbered by their position in DIRECTIONS.
+
+    Instance Attributes:
+        - num_locations: the number of locations
+        - exits: the id of the location each exit leads to, or 0 if there is no exit, at position
+          (loc_id - 1) * len(DIRECTIONS) + direction
+        - keys: a mapping from the id of each locked location to the id of the item that unlocks it
+        - items_at: a mapping from location id to the names of the items that start there
+        - items: the data of every item, in the format of game_data.json
+
+    Representation Invariants:
+        - len(self.exits) == self.num_locations * len(DIRECTIONS)
+        - 1 not in self.keys
+    """
+    num_locations: int
+    exits: array
+    keys: dict[int, int]
+    items_at: dict[int, list[str]]
+    items: list[dict[str, Any]]
+
+    def __init__(self, num_locations: int) -> None:
+        """Initialize a layout of num_locations locations with no exits, locks or items."""
+        self.num_locations = num_locations
+        self.exits = array('i', [0]) * (num_locations * len(DIRECTIONS))
+        self.keys = {}
+        self.items_at = {}
+        self.items = []
+
+    def free_directions(self, loc_id: int) -> list[int]:
+        """Return the directions in which the location with the given id has no exit yet."""
+        base = (loc_id - 1) * len(DIRECTIONS)
+        return [d for d in range(len(DIRECTIONS)) if self.exits[base + d] == 0]
+
+    def join(self, loc_id: int, direction: int, other_id: int) -> None:
+        """Add an exit in the given direction from one location to the other, and the opposite exit back.
+
+        Preconditions:
+            - neither exit exists yet
+        """
+        back = _BACK[direction]
+        self.exits[(loc_id - 1) * len(DIRECTIONS) + direction] = other_id
+        self.exits[(other_id - 1) * len(DIRECTIONS) + back] = loc_id
+
+    def add_item(self, name: str, loc_id: int, points: int, description: str) -> int:
+        """Add a takeable item with the given name and points, starting at the given location, with the start as its
+        target position. Return its id."""
+        item_id = len(self.items) + 1
+        self.items.append({'id': item_id, 'name': name, 'description': description, 'can_take': True,
+                           'target_position': 1, 'target_points': points})
+        self.items_at.setdefault(loc_id, []).append(name)
+        return item_id
+
+
+def _lay_out(num_locations: int, num_goals: int, num_locks: int, rng: random.Random) -> _Layout:
+    """Return the layout of a new solvable world (see the top of this module)."""
+    layout = _Layout(num_locations)
+
+    # Join every location to an earlier one with a free direction, keeping track of the locations that have one
+    open_ids = [1]
+    for loc_id in range(2, num_locations + 1):
+        while True:
+            if rng.random() < CORRIDOR_CHANCE and layout.free_directions(loc_id - 1):
+                parent = loc_id - 1
+            else:
+                k = rng.randrange(len(open_ids))
+                parent = open_ids[k]
+            free = layout.free_directions(parent)
+            if free:
+                break
+            # parent is full, so it is removed from open_ids (by swapping the last id into its place)
+            open_ids[k] = open_ids[-1]
+            open_ids.pop()
+        direction = rng.choice(free)
+        layout.join(parent, direction, loc_id)
+        open_ids.append(loc_id)
+
+    # Add exits between random locations, wherever both have the matching directions free
+    for _ in range(int(num_locations * EXTRA_EXITS)):
+        a, b = rng.randint(1, num_locations), rng.randint(1, num_locations)
+        if a == b:
+            continue
+        for direction in layout.free_directions(a):
+            if _BACK[direction] in layout.free_directions(b):
+                layout.join(a, direction, b)
+                break
+
+    # Lock random locations other than the start, each with a key in a location with a smaller id
+    for loc_id in rng.sample(range(2, num_locations + 1), num_locks):
+        key_id = layout.add_item(f"key_{len(layout.keys) + 1}", rng.randint(1, loc_id - 1), 0,
+                                 f"A key with a tag that reads {loc_id}.")
+        layout.keys[loc_id] = key_id
+
+    # Scatter the goal items anywhere but the start (where they would already be delivered)
+    for i in range(1, num_goals + 1):
+        layout.add_item(f"goal_{i}", rng.randint(2, num_locations), 10 * rng.randint(1, 5),
+                        f"Lost item number {i}. It belongs back at the start.")
+    return layout
+
+
+def _location_data(layout: _Layout, loc_id: int, rng: random.Random) -> dict[str, Any]:
+    """Return the data of the location with the given id in the given layout, in the format of game_data.json."""
+    name = f"{rng.choice(ADJECTIVES)} {rng.choice(PLACES)}"
+    base = (loc_id - 1) * len(DIRECTIONS)
+    commands = {DIRECTIONS[_NAMES[d]]: layout.exits[base + d]
+                for d in range(len(DIRECTIONS)) if layout.exits[base + d] != 0}
+    exits = ', '.join(command[3:] for command in commands)
+    data = {'id': loc_id, 'name': name,
+            'brief_description': f"You are in the {name.lower()}. Exits: {exits}.",
+            'long_description': f"You are in the {name.lower()}, room {loc_id} of the campus. It looks much like the "
+                                f"others. Exits lead {exits}.",
+            'available_commands': commands,
+            'items': layout.items_at.get(loc_id, [])}
+    if loc_id in layout.keys:
+        data['locked'] = True
+        data['key_id'] = layout.keys[loc_id]
+    return data
+
+
+def _check_sizes(num_locations: int, num_goals: int, num_locks: int) -> None:
+    """Raise ValueError if a world with the given numbers of locations, goal items and locks cannot be generated."""
+    if num_locations < 2:
+        raise ValueError("a world needs at least 2 locations")
+    if num_goals < 1:
+        raise ValueError("a world needs at least 1 goal item")
+    if not 0 <= num_locks < num_locations:
+        raise ValueError("there must be fewer locks than locations")
+
+
+def generate_world(num_locations: int, num_goals: int = 3, num_locks: int = 0, seed: int = 0) -> dict[str, Any]:
+    """Return the game data (in the format of game_data.json) of a new solvable world with the given numbers of
+    locations, goal items (which must be returned to location 1) and locked locations, generated from the given seed.
+
+    Raise ValueError if there are fewer than 2 locations, no goal items, or at least as many locks as locations.
+
+    >>> from solver import solve
+    >>> from world_template import parse_world
+    >>> data = generate_world(200, num_goals=3, num_locks=4, seed=1)
+    >>> len(data['locations']), len(data['items'])
+    (200, 7)
+    >>> data == generate_world(200, num_goals=3, num_locks=4, seed=1)
+    True
+    >>> solve(parse_world(data), 1) is not None
+    True
+    """
+    _check_sizes(num_locations, num_goals, num_locks)
+    rng = random.Random(seed)
+    layout = _lay_out(num_locations, num_goals, num_locks, rng)
+    return {'locations': [_location_data(layout, loc_id, rng) for loc_id in range(1, num_locations + 1)],
+            'items': layout.items}
+
+
+def write_world(out: TextIO, num_locations: int, num_goals: int = 3, num_locks: int = 0, seed: int = 0) -> None:
+    """Write the same world as generate_world (with the same arguments) to out as JSON, one location at a time,
+    so the whole world is never held in memory.
+
+    Raise ValueError if there are fewer than 2 locations, no goal items, or at least as many locks as locations.
+    """
+    _check_sizes(num_locations, num_goals, num_locks)
+    rng = random.Random(seed)
+    layout = _lay_out(num_locations, num_goals, num_locks, rng)
+    out.write('{"locations": [\n')
+    for loc_id in range(1, num_locations + 1):
+        if loc_id > 1:
+            out.write(',\n')
+        out.write(json.dumps(_location_data(layout, loc_id, rng)))
+    out.write('\n],\n"items": ')
+    out.write(json.dumps(layout.items))
+    out.write('}\n')
+
+
+def generate_world_file(filename: str, num_locations: int, num_goals: int = 3, num_locks: int = 0,
+                        seed: int = 0) -> None:
+    """Write a new world (see write_world) to the file with the given name."""
+    with open(filename, 'w') as f:
+        write_world(f, num_locations, num_goals, num_locks, seed)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Generate a world file from the command line."""
+    parser = argparse.ArgumentParser(description="Generate a large random game world that can be won.")
+    parser.add_argument('output', help="game data file to write")
+    parser.add_argument('--locations', type=int, default=1000, help="number of locations")
+    parser.add_argument('--goals', type=int, default=3, help="number of items to return to location 1")
+    parser.add_argument('--locks', type=int, default=0, help="number of locked locations")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    args = parser.parse_args(argv)
+
+    try:
+        generate_world_file(args.output, args.locations, args.goals, args.locks, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    main(sys.argv[1:])
@@ -0,0 +1,216 @@
+"""CSC111 Project 1: Text Adventure Game - World Map Index
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the WorldIndex class, which answers questions about the map of a world (which exits a
+location has, how far apart two locations are, and which locations can be reached past which doors) without
+walking the map again for every question.
+
+Each answer is computed once and then remembered, so repeated questions are a dictionary lookup. Searches of the
+map only go as far as the question needs, and carry on from where they stopped when a later question needs more.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from collections import OrderedDict, deque
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from world_template import WorldTemplate
+
+# The directions a player can move in, in the order they are listed to the player, mapped to their commands
+DIRECTIONS = {
+    "north": "go north",
+    "east": "go east",
+    "south": "go south",
+    "west": "go west",
+    "up": "go up",
+    "down": "go down"
+}
+
+# The most distances a WorldIndex remembers by default, across all of its searches. Each takes roughly 100 bytes, so
+# this keeps an index under about 50 MB however large its world is.
+MAX_ENTRIES = 500_000
+
+# The index of each world that has been indexed
+_INDEXES: WeakKeyDictionary[WorldTemplate, WorldIndex] = WeakKeyDictionary()
+
+
+class _Search:
+    """A breadth-first search of the map from one location, which can be stopped and carried on later.
+
+    Instance Attributes:
+        - tree: a mapping from every location reached so far to its distance from the source
+        - queue: the locations reached whose exits have not been followed yet, in the order they were reached
+        - unlocked: the locked locations the search may pass through, or None if it ignores locks
+
+    Representation Invariants:
+        - all(loc_id in self.tree for loc_id in self.queue)
+    """
+    tree: dict[int, int]
+    queue: deque[int]
+    unlocked: Optional[frozenset[int]]
+
+    def __init__(self, source: int, unlocked: Optional[frozenset[int]]) -> None:
+        """Initialize a new search from the given source, that has not followed any exits yet."""
+        self.tree = {source: 0}
+        self.queue = deque([source])
+        self.unlocked = unlocked
+
+    def finished(self) -> bool:
+        """Return whether every location that can be reached has been reached."""
+        return not self.queue
+
+    def run(self, world: WorldTemplate, targets: Optional[set[int]] = None) -> None:
+        """Carry on the search in the given world until it has reached every location in targets (or every location
+        that can be reached, if targets is None or some target cannot be reached)."""
+        remaining = None if targets is None else {loc_id for loc_id in targets if loc_id not in self.tree}
+        tree = self.tree
+        queue = self.queue
+        while queue and (remaining is None or remaining):
+            loc_id = queue.popleft()
+            for dest_id in world.locations[loc_id].available_commands.values():
+                if dest_id not in tree and (self.unlocked is None or dest_id in self.unlocked
+                                            or not world.locations[dest_id].locked):
+                    tree[dest_id] = tree[loc_id] + 1
+                    queue.append(dest_id)
+                    if remaining is not None:
+                        remaining.discard(dest_id)
+
+
+class WorldIndex:
+    """An index of the map of one world.
+
+    Distances are counted in moves. A set of unlocked location ids can be given when asking about distances: locked
+    locations that are not in the set are treated as walls. Passing None ignores locks entirely.
+
+    >>> from world_template import load_world
+    >>> index = WorldIndex(load_world('game_data.json'))
+    >>> index.exits(1)
+    {'north': (2, 'Hallway')}
+    >>> index.distance(1, 6)
+    4
+    >>> index.distance(1, 6, frozenset()) is None  # Robarts Library (4) is locked
+    True
+    >>> index.distance(1, 6, frozenset({4}))
+    4
+    >>> index.distances_to(2, [1, 3, 6])
+    {1: 1, 3: 1, 6: 3}
+    """
+    # Private Instance Attributes:
+    #   - _world: the world this index is for
+    #   - _exits: the exits of each location looked up so far, mapping location id to a mapping from direction to
+    #             the (id, name) of the location in that direction
+    #   - _searches: the most recently used searches, least recently used first, mapping (source id, unlocked ids or
+    #                None) to the search from that source
+    #   - _entries: the number of distances remembered by the searches in _searches
+    #   - _max_entries: the most distances remembered by the searches in _searches (apart from the one in use)
+    _world: WorldTemplate
+    _exits: dict[int, dict[str, tuple[int, str]]]
+    _searches: OrderedDict[tuple[int, Optional[frozenset[int]]], _Search]
+    _entries: int
+    _max_entries: int
+
+    def __init__(self, world: WorldTemplate, max_entries: int = MAX_ENTRIES) -> None:
+        """Initialize a new index of the given world, remembering at most max_entries distances across its searches
+        (apart from those of the search in use, which may be more).
+
+        Preconditions:
+            - max_entries > 0
+        """
+        self._world = world
+        self._exits = {}
+        self._searches = OrderedDict()
+        self._entries = 0
+        self._max_entries = max_entries
+
+    def exits(self, loc_id: int) -> dict[str, tuple[int, str]]:
+        """Return a mapping from each direction the player can move in from the given location, in DIRECTIONS order,
+        to the id and name of the location in that direction.
+        """
+        exits = self._exits.get(loc_id)
+        if exits is None:
+            commands = self._world.locations[loc_id].available_commands
+            exits = {}
+            for direction, command in DIRECTIONS.items():
+                if command in commands:
+                    dest_id = commands[command]
+                    exits[direction] = (dest_id, self._world.locations[dest_id].name)
+            self._exits[loc_id] = exits
+        return exits
+
+    def _search(self, source: int, unlocked: Optional[frozenset[int]], targets: Optional[set[int]]) -> _Search:
+        """Return the search from the given source, carried on until it has reached every location in targets (or
+        every location, if targets is None). Searches are forgotten, least recently used first, once they remember
+        more than _max_entries distances between them."""
+        key = (source, unlocked)
+        search = self._searches.get(key)
+        if search is None:
+            search = _Search(source, unlocked)
+            self._searches[key] = search
+            self._entries += 1
+        else:
+            self._searches.move_to_end(key)
+
+        if not search.finished():
+            reached = len(search.tree)
+            search.run(self._world, targets)
+            self._entries += len(search.tree) - reached
+        while self._entries > self._max_entries and len(self._searches) > 1:
+            _, forgotten = self._searches.popitem(last=False)
+            self._entries -= len(forgotten.tree)
+        return search
+
+    def distances(self, source: int, unlocked: Optional[frozenset[int]] = None) -> dict[int, int]:
+        """Return a mapping from every location reachable from the given source to its distance from the source.
+
+        The returned dictionary is shared with later calls, so it must not be changed.
+        """
+        return self._search(source, unlocked, None).tree
+
+    def distances_to(self, source: int, targets: list[int],
+                     unlocked: Optional[frozenset[int]] = None) -> dict[int, int]:
+        """Return a mapping from each of the given targets that can be reached from the given source to its distance
+        from the source, searching the map only as far as the farthest target."""
+        tree = self._search(source, unlocked, set(targets)).tree
+        return {target: tree[target] for target in targets if target in tree}
+
+    def distance(self, source: int, target: int, unlocked: Optional[frozenset[int]] = None) -> Optional[int]:
+        """Return the fewest moves needed to get from source to target, or None if target cannot be reached."""
+        return self._search(source, unlocked, {target}).tree.get(target)
+
+    def is_reachable(self, source: int, target: int, unlocked: Optional[frozenset[int]] = None) -> bool:
+        """Return whether target can be reached from source."""
+        return self.distance(source, target, unlocked) is not None
+
+
+def index_for(world: WorldTemplate) -> WorldIndex:
+    """Return the shared index of the given world, creating it the first time it is needed."""
+    index = _INDEXES.get(world)
+    if index is None:
+        index = WorldIndex(world)
+        _INDEXES[world] = index
+    return index
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    import doctest
+    doctest.testmod()
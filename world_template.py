@@ -0,0 +1,248 @@
+"""CSC111 Project 1: Text Adventure Game - Shared World Templates
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the read-only "template" of a game world: the locations and items exactly as they are
+described in a game data file, before any player has changed them.
+
+A template is parsed once per game data file and shared by every AdventureGame created from that file. Games never
+change the template's Location objects; instead, a game copies a location the first time it needs to change it
+(copy-on-write), so each game only holds the few locations the player has actually affected.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+
+from game_entities import Location, Item
+from item_resolver import ItemResolver
+
+
+class WorldTemplate:
+    """The static, shared part of a game world.
+
+    Instance Attributes:
+        - locations: a mapping from location id to the original Location object for that id
+        - items: all Item objects in the world, in the order they appear in the game data
+        - items_by_name: a mapping from the lowercase name of each item to its Item object
+        - items_by_id: a mapping from the id of each item to its Item object
+        - resolver: the resolver for the names, aliases and prefixes the player can use to refer to items
+        - goal_items: the items worth points (target_points > 0), which must all be delivered to their target
+          positions to win
+        - secret_items: the items that end the game with the secret ending when delivered to their target positions
+        - goals_at_start, secrets_at_start: the number of goal items and secret items that start at their target
+          positions
+
+    Representation Invariants:
+        - all(loc_id == self.locations[loc_id].id_num for loc_id in self.locations)
+        - all(self.items_by_name[item.name.lower()] is item for item in self.items)
+        - all(self.items_by_id[item.id] is item for item in self.items)
+        - all(not location.visited for location in self.locations.values())
+
+    The Location and Item objects in a template are shared between games, so they must never be mutated, and the map
+    of a world never changes once it is loaded. To make this easier to keep (and to save memory), each template
+    location stores its items as a tuple.
+    """
+    locations: Mapping[int, Location]
+    items: list[Item]
+    items_by_name: dict[str, Item]
+    items_by_id: dict[int, Item]
+    resolver: ItemResolver
+    goal_items: list[Item]
+    secret_items: list[Item]
+    goals_at_start: int
+    secrets_at_start: int
+
+    def __init__(self, locations: Mapping[int, Location], items: list[Item]) -> None:
+        """Initialize a new world template with the given locations and items.
+
+        Preconditions:
+            - item names and ids are unique (ignoring case for names)
+        """
+        self.locations = locations
+        self.items = items
+        self.items_by_name = {item.name.lower(): item for item in items}
+        self.items_by_id = {item.id: item for item in items}
+        self.resolver = ItemResolver(items)
+        self.goal_items = [item for item in items if item.target_points > 0]
+        self.secret_items = [item for item in items if item.secret_ending]
+        self.goals_at_start = count_delivered(locations, self.goal_items)
+        self.secrets_at_start = count_delivered(locations, self.secret_items)
+
+
+class CachedLocations(Mapping[int, Location], ABC):
+    """A read-only mapping from location id to Location, for a world whose locations are loaded from its file only
+    when they are looked up. At most capacity loaded locations are kept in memory (least recently used first out).
+
+    Subclasses load a location from their file in _load, and give the ids of the locations in the file through
+    __contains__, __iter__ and __len__ (without loading any location).
+
+    Representation Invariants:
+        - len(self._cache) <= self._capacity
+    """
+    # Private Instance Attributes:
+    #   - _cache: the most recently used Location objects, least recently used first
+    #   - _capacity: the maximum number of Location objects kept in _cache
+    _cache: OrderedDict[int, Location]
+    _capacity: int
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize a new mapping that keeps at most capacity locations in memory.
+
+        Preconditions:
+            - capacity > 0
+        """
+        self._cache = OrderedDict()
+        self._capacity = capacity
+
+    def __getitem__(self, loc_id: int) -> Location:
+        """Return the location with the given id, loading it from the file if it is not in memory."""
+        location = self._cache.get(loc_id)
+        if location is not None:
+            self._cache.move_to_end(loc_id)
+            return location
+
+        location = self._load(loc_id)
+        self._cache[loc_id] = location
+        if len(self._cache) > self._capacity:
+            self._cache.popitem(last=False)
+        return location
+
+    @abstractmethod
+    def _load(self, loc_id: int) -> Location:
+        """Load and return the location with the given id from the file.
+
+        Raise KeyError if there is no location with the given id.
+        """
+
+    def hydrated_count(self) -> int:
+        """Return the number of Location objects currently held in memory."""
+        return len(self._cache)
+
+
+def count_delivered(locations: Mapping[int, Location], items: list[Item]) -> int:
+    """Return how many of the given items are at their target positions in the given locations."""
+    return sum(1 for item in items
+               if item.target_position in locations and item.name in locations[item.target_position].items)
+
+
+# Game data files at least this large (in bytes) are loaded lazily, one location at a time (see lazy_world.py)
+LAZY_LOAD_THRESHOLD = 16 * 1024 * 1024
+
+# The most templates kept in _TEMPLATES. Games hold on to the template they were started in, so a template dropped
+# from the cache lives on until its last game ends.
+MAX_TEMPLATES = 16
+
+# A cache of the most recently loaded templates (least recently used first), mapping each game data file's absolute
+# path and whether it was loaded lazily to the file's (modification time, size) when it was loaded and the template
+# loaded from it.
+_TEMPLATES: OrderedDict[tuple[str, bool], tuple[tuple[int, int], WorldTemplate]] = OrderedDict()
+
+
+def parse_location(loc_data: dict[str, Any], strings: Optional[dict[str, str]] = None) -> Location:
+    """Return the template Location for the given location data, in the format of game_data.json.
+
+    Command and item names repeat across many locations, so they are interned: every location refers to a single
+    copy of each name. Names and descriptions are also looked up in strings (when given), a table shared while
+    parsing one world, so that locations with the same text share one copy of it.
+    """
+    if strings is None:
+        strings = {}
+    commands = {sys.intern(command): dest_id for command, dest_id in loc_data['available_commands'].items()}
+    items = tuple(sys.intern(item_name) for item_name in loc_data['items'])
+    return Location(loc_data['id'], strings.setdefault(loc_data['name'], loc_data['name']),
+                    strings.setdefault(loc_data['brief_description'], loc_data['brief_description']),
+                    strings.setdefault(loc_data['long_description'], loc_data['long_description']),
+                    commands, items, False, loc_data.get('locked', False), loc_data.get('key_id', -1))
+
+
+def parse_item(item_data: dict[str, Any]) -> Item:
+    """Return the Item for the given item data, in the format of game_data.json."""
+    return Item(item_data['id'], sys.intern(item_data['name']), item_data['description'], item_data['can_take'],
+                item_data['target_position'], item_data['target_points'],
+                tuple(sys.intern(alias) for alias in item_data.get('aliases', [])),
+                item_data.get('secret_ending', False))
+
+
+def parse_world(data: dict[str, Any]) -> WorldTemplate:
+    """Return a new world template for the given game data, in the format of game_data.json."""
+    locations = {}
+    strings = {}
+    for loc_data in data['locations']:  # Go through each element associated with the 'locations' key in the file
+        locations[loc_data['id']] = parse_location(loc_data, strings)
+
+    items = [parse_item(item_data) for item_data in data['items']]
+
+    return WorldTemplate(locations, items)
+
+
+def load_world(filename: str, lazy: Optional[bool] = None) -> WorldTemplate:
+    """Return the world template for the game data file with the given filename.
+
+    The file is only parsed the first time it is loaded (or after it changes on disk); later calls asking for the
+    same kind of loading return the same shared template. If lazy is True, or lazy is None and the file is at least
+    LAZY_LOAD_THRESHOLD bytes, locations are only parsed when they are first looked up. Compiled world files (see
+    world_compiler.py) are always loaded this way.
+
+    >>> load_world('game_data.json') is load_world('game_data.json')
+    True
+    >>> isinstance(load_world('game_data.json', lazy=True).locations, dict)
+    False
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON file, or of a compiled world file
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    if lazy is None:
+        lazy = stat.st_size >= LAZY_LOAD_THRESHOLD
+    cached = _TEMPLATES.get((path, lazy))
+    if cached is not None and cached[0] == version:
+        _TEMPLATES.move_to_end((path, lazy))
+        return cached[1]
+
+    # world_compiler and lazy_world depend on this module, so they are imported here
+    from world_compiler import is_compiled_world, load_compiled_world
+
+    if is_compiled_world(path):
+        # A compiled world is loaded lazily however it is asked for, so both kinds share one template
+        world = load_compiled_world(path)
+        _TEMPLATES[(path, not lazy)] = (version, world)
+    elif lazy:
+        from lazy_world import load_lazy_world
+        world = load_lazy_world(path)
+    else:
+        with open(path, 'r') as f:
+            world = parse_world(json.load(f))
+    _TEMPLATES[(path, lazy)] = (version, world)
+    while len(_TEMPLATES) > MAX_TEMPLATES:
+        _TEMPLATES.popitem(last=False)
+    return world
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+    pass
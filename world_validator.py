@@ -0,0 +1,299 @@
+"""CSC111 Project 1: Text Adventure Game - World Validator
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module checks that a game data file describes a world that can be played and won, before a game is
+started in it, instead of letting mistakes in the file surface as a KeyError partway through a game.
+
+The checks are:
+    - every location and item has the fields of game_data.json, with the right types (including the optional
+      fields locked, key_id, aliases and secret_ending, when they are given)
+    - no two locations share an id, no two items share an id, and no name or alias refers to two items (ignoring
+      case, as players can type them in any case)
+    - every exit leads to a location that exists, and every locked location has a key that exists
+    - every item named in a location exists under exactly that name (with the same case), and is only in one
+      location
+    - every item's target position is a location that exists
+    - the game can be won (ignoring the move limit): starting from the start location, and picking up keys to open
+      locked locations along the way, every item worth points can be reached, taken, and brought to its target
+
+The result is cached. The first time a file is validated, it is also compiled (see world_compiler.py) into a cache
+directory, under a name made from a hash of the file's contents. Starting a game in the same file again then finds
+the compiled file and uses it straight away, skipping both the checks and the JSON parsing. Any change to the file
+changes its hash, so a changed file is always validated again.
+
+Check a game data file from the command line with:
+
+    python world_validator.py game_data.json 1
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sys
+from typing import Any
+
+from world_compiler import FORMAT_VERSION, compile_world, is_compiled_world
+from world_template import WorldTemplate, load_world
+
+# The fields every location and item must have in a game data file, and their types
+LOCATION_FIELDS = {'id': int, 'name': str, 'brief_description': str, 'long_description': str,
+                   'available_commands': dict, 'items': list}
+ITEM_FIELDS = {'id': int, 'name': str, 'description': str, 'can_take': bool, 'target_position': int,
+               'target_points': int}
+
+# The fields locations and items may leave out, and their types when they are given
+OPTIONAL_LOCATION_FIELDS = {'locked': bool, 'key_id': int}
+OPTIONAL_ITEM_FIELDS = {'aliases': list, 'secret_ending': bool}
+
+# The directory validated worlds are cached in, relative to the current directory
+CACHE_DIR = '.world_cache'
+
+
+def _bad_fields(data: Any, fields: dict[str, type], optional: dict[str, type]) -> list[str]:
+    """Return the names of the given fields that the given data is missing, or has a value of the wrong type for,
+    followed by the names of the given optional fields that the data has a value of the wrong type for."""
+    if not isinstance(data, dict):
+        return list(fields)
+    return [name for name, kind in fields.items() if name not in data or not _is_kind(data[name], kind)] \
+        + [name for name, kind in optional.items() if name in data and not _is_kind(data[name], kind)]
+
+
+def _is_kind(value: Any, kind: type) -> bool:
+    """Return whether the given value from a game data file has the given type. Booleans are not integers, and
+    lists must only hold strings (the only lists in a location or item are of names).
+    """
+    if kind is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    if kind is list:
+        return isinstance(value, list) and all(isinstance(element, str) for element in value)
+    return isinstance(value, kind)
+
+
+def validate_world(data: Any, start_id: int = 1) -> list[str]:
+    """Return a description of every problem with the given game data (in the format of game_data.json), for a game
+    starting at the location with id start_id. Return an empty list if there are none.
+
+    Whether the game can be won is only checked if there are no other problems.
+
+    >>> with open('game_data.json') as f:
+    ...     data = json.load(f)
+    >>> validate_world(data, 1)
+    []
+    >>> data['locations'][0]['available_commands']['go west'] = 99
+    >>> data['locations'][3]['key_id'] = 42
+    >>> for problem in validate_world(data, 1):
+    ...     print(problem)
+    location 1: "go west" leads to location 99, which does not exist
+    location 4: its key (item 42) does not exist
+    >>> data['locations'][3]['locked'] = "no"
+    >>> data['locations'][0]['items'] = ['T_Card']
+    >>> data['items'][0]['aliases'] = ['usb', 'card']
+    >>> for problem in validate_world(data, 1):
+    ...     print(problem)
+    location #4: missing or invalid locked
+    item 4: the alias 'card' is used by more than one item
+    location 1: "go west" leads to location 99, which does not exist
+    location 1: item 'T_Card' does not exist (names are case-sensitive: did you mean 't_card'?)
+    location 3: "go north" leads to location 4, which does not exist
+    location 6: "go west" leads to location 4, which does not exist
+    """
+    if not isinstance(data, dict) or not isinstance(data.get('locations'), list) \
+            or not isinstance(data.get('items'), list):
+        return ["the game data must be an object with a list of locations and a list of items"]
+    problems = []
+
+    locations = {}
+    for position, loc_data in enumerate(data['locations'], start=1):
+        bad_fields = _bad_fields(loc_data, LOCATION_FIELDS, OPTIONAL_LOCATION_FIELDS)
+        if bad_fields:
+            problems.append(f"location #{position}: missing or invalid {', '.join(bad_fields)}")
+        elif loc_data['id'] in locations:
+            problems.append(f"location {loc_data['id']}: the id is used by more than one location")
+        else:
+            locations[loc_data['id']] = loc_data
+
+    items_by_id = {}
+    items_by_name = {}
+    for position, item_data in enumerate(data['items'], start=1):
+        bad_fields = _bad_fields(item_data, ITEM_FIELDS, OPTIONAL_ITEM_FIELDS)
+        if bad_fields:
+            problems.append(f"item #{position}: missing or invalid {', '.join(bad_fields)}")
+        elif item_data['id'] in items_by_id:
+            problems.append(f"item {item_data['id']}: the id is used by more than one item")
+        elif item_data['name'].lower() in items_by_name:
+            problems.append(f"item {item_data['id']}: the name {item_data['name']!r} is used by more than one item")
+        else:
+            items_by_id[item_data['id']] = item_data
+            items_by_name[item_data['name'].lower()] = item_data
+            if item_data['target_position'] not in locations:
+                problems.append(f"item {item_data['name']!r}: its target position {item_data['target_position']} "
+                                f"does not exist")
+
+    # Aliases are checked once every name is known, since an alias may clash with the name of a later item
+    names = dict(items_by_name)
+    for item_data in items_by_id.values():
+        for alias in item_data.get('aliases', []):
+            owner = names.setdefault(alias.lower(), item_data)
+            if owner is not item_data:
+                problems.append(f"item {item_data['id']}: the alias {alias!r} is used by more than one item")
+    # Only names (not aliases) can be used for the items of locations, and the game matches those exactly
+    items_by_exact_name = {item_data['name']: item_data for item_data in items_by_id.values()}
+
+    # The location each item starts at, by name
+    placed = {}
+    for loc_id, loc_data in locations.items():
+        for command, dest_id in loc_data['available_commands'].items():
+            if dest_id not in locations:
+                problems.append(f"location {loc_id}: \"{command}\" leads to location {dest_id}, which does not exist")
+        if loc_data.get('locked', False) and loc_data.get('key_id', -1) not in items_by_id:
+            problems.append(f"location {loc_id}: its key (item {loc_data.get('key_id', -1)}) does not exist")
+        for item_name in loc_data['items']:
+            if item_name not in items_by_exact_name:
+                item_data = items_by_name.get(item_name.lower())
+                hint = "" if item_data is None else f" (names are case-sensitive: did you mean {item_data['name']!r}?)"
+                problems.append(f"location {loc_id}: item {item_name!r} does not exist{hint}")
+            elif item_name.lower() in placed:
+                problems.append(f"location {loc_id}: item {item_name!r} is also in location "
+                                f"{placed[item_name.lower()]}")
+            else:
+                placed[item_name.lower()] = loc_id
+
+    if start_id not in locations:
+        problems.append(f"the start location {start_id} does not exist")
+    if not problems:
+        problems.extend(_winning_problems(locations, items_by_name, placed, start_id))
+    return problems
+
+
+def _winning_problems(locations: dict[int, dict[str, Any]], items_by_name: dict[str, dict[str, Any]],
+                      placed: dict[str, int], start_id: int) -> list[str]:
+    """Return a description of every item worth points that cannot be brought to its target, in a world with the
+    given (valid) locations and items, where placed maps each item's lowercase name to where it starts.
+
+    The locations the player can reach are found in one search from the start. Keys can be carried indefinitely and
+    unlocked locations stay unlocked, so a locked location can be reached exactly when its key can be, and a locked
+    location found before its key waits until the key is found.
+    """
+    reached = {start_id}
+    keys = set()
+    waiting: dict[int, list[int]] = {}
+    stack = [start_id]
+    while stack:
+        loc_data = locations[stack.pop()]
+        for item_name in loc_data['items']:
+            item_data = items_by_name[item_name.lower()]
+            if item_data['can_take'] and item_data['id'] not in keys:
+                keys.add(item_data['id'])
+                for loc_id in waiting.pop(item_data['id'], []):
+                    if loc_id not in reached:
+                        reached.add(loc_id)
+                        stack.append(loc_id)
+        for dest_id in loc_data['available_commands'].values():
+            if dest_id in reached:
+                continue
+            dest_data = locations[dest_id]
+            if dest_data.get('locked', False) and dest_data['key_id'] not in keys:
+                waiting.setdefault(dest_data['key_id'], []).append(dest_id)
+            else:
+                reached.add(dest_id)
+                stack.append(dest_id)
+
+    problems = []
+    for name, item_data in items_by_name.items():
+        if item_data['target_points'] <= 0 or placed.get(name) == item_data['target_position']:
+            continue
+        if name not in placed:
+            problems.append(f"item {item_data['name']!r} is worth points but is not in any location")
+        elif not item_data['can_take']:
+            problems.append(f"item {item_data['name']!r} is worth points but cannot be taken")
+        elif placed[name] not in reached:
+            problems.append(f"item {item_data['name']!r} is in location {placed[name]}, which cannot be reached")
+        elif item_data['target_position'] not in reached:
+            problems.append(f"item {item_data['name']!r} belongs in location {item_data['target_position']}, "
+                            f"which cannot be reached")
+    return problems
+
+
+def file_hash(filename: str) -> str:
+    """Return the SHA-256 hash of the contents of the file with the given name, in hexadecimal."""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def validated_world_file(filename: str, start_id: int = 1, cache_dir: str = CACHE_DIR) -> str:
+    """Return the name of a compiled world file for the game data file with the given name, validating it (for a game
+    starting at the location with id start_id) unless it was already validated.
+
+    Compiled world files are returned as they are, since only JSON game data can be validated. If the cache directory
+    cannot be written, the game data is still validated, and filename itself is returned.
+
+    Raise ValueError, listing every problem, if the game data is not valid.
+    """
+    if is_compiled_world(filename):
+        return filename
+
+    cached = os.path.join(cache_dir, f"{file_hash(filename)}-{start_id}-v{FORMAT_VERSION}.world")
+    if os.path.exists(cached):
+        return cached
+
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    problems = validate_world(data, start_id)
+    if problems:
+        raise ValueError(f"{filename} is not a valid game world:\n"
+                         + '\n'.join(f"  - {problem}" for problem in problems))
+
+    # The compiled file is written under a temporary name first, so that no process ever sees half of it
+    temporary = f"{cached}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temporary, 'wb') as f:
+            f.write(compile_world(data))
+        os.replace(temporary, cached)
+    except OSError:
+        return filename
+    return cached
+
+
+def load_validated_world(filename: str, start_id: int = 1, cache_dir: str = CACHE_DIR) -> WorldTemplate:
+    """Return the world template for the game data file with the given name, validating it first unless it was
+    already validated (see validated_world_file).
+
+    Raise ValueError, listing every problem, if the game data is not valid.
+    """
+    return load_world(validated_world_file(filename, start_id, cache_dir))
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
+
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python world_validator.py <game data file> [initial location id]")
+    else:
+        with open(sys.argv[1], 'r') as data_file:
+            world_problems = validate_world(json.load(data_file), int(sys.argv[2]) if len(sys.argv) == 3 else 1)
+        print('\n'.join(world_problems) if world_problems else f"{sys.argv[1]} is valid.")
+        sys.exit(1 if world_problems else 0)